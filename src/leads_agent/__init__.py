@@ -2,8 +2,15 @@
 
 __version__ = "0.1.0"
 
-from leads_agent.models import LeadClassification, LeadLabel
-from leads_agent.prompts import ICPConfig, PromptConfig, PromptManager
+# Public names are resolved on first access, so importing a submodule (as the CLI
+# entry point does) doesn't pull in pydantic and the prompt stack up front.
+_LAZY_EXPORTS = {
+    "LeadClassification": "leads_agent.models",
+    "LeadLabel": "leads_agent.models",
+    "PromptConfig": "leads_agent.prompts",
+    "ICPConfig": "leads_agent.prompts",
+    "PromptManager": "leads_agent.prompts",
+}
 
 __all__ = [
     "LeadClassification",
@@ -13,3 +20,14 @@ __all__ = [
     "PromptManager",
     "__version__",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
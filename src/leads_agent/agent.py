@@ -1,27 +1,50 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
 import hashlib
+import json
+import logging
 import os
-from contextlib import contextmanager
+import re
+import threading
+import weakref
+from collections import Counter
+from collections.abc import Hashable
+from contextlib import contextmanager, suppress
+from functools import lru_cache
 from dataclasses import dataclass, field
-from typing import Any, Callable, TypeVar, overload
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, TypeVar, overload
+from urllib.parse import urlparse
 
+import httpx
 import logfire
 from opentelemetry import trace
+from pydantic import BaseModel, Field
 from pydantic_ai import Agent
 from pydantic_ai.common_tools.duckduckgo import duckduckgo_search_tool
 from pydantic_ai.messages import ModelMessage
+from pydantic_ai.models import get_user_agent
+from pydantic_ai.output import NativeOutput, OutputSpec
 from pydantic_ai.models.openai import OpenAIChatModel, OpenAIChatModelSettings
 from pydantic_ai.providers.openai import OpenAIProvider
 
+from leads_agent.cache import cache_key, get_response_cache, normalize_text
+from leads_agent.common import json_dumps
 from leads_agent.config import Settings
 from leads_agent.models import (
     EnrichedLeadClassification,
     HubSpotLead,
     LeadClassification,
+    LeadLabel,
 )
 from leads_agent.prompts import get_prompt_manager
 
+if TYPE_CHECKING:
+    from leads_agent.batcher import TriageBatcher
+
+logger = logging.getLogger(__name__)
+
 # Configure logfire only if token is available
 _logfire_enabled = bool(os.environ.get("LOGFIRE_TOKEN"))
 if _logfire_enabled:
@@ -69,26 +92,30 @@ class ClassificationResult:
     def format_history(self, verbose: bool = False) -> str:
         """Format message history for debugging output."""
         lines = []
+        append = lines.append
         for i, msg in enumerate(self.message_history):
-            msg_type = type(msg).__name__
-            lines.append(f"\n[{i}] {msg_type}")
-
-            if hasattr(msg, "parts"):
-                for part in msg.parts:
-                    part_type = type(part).__name__
-                    if hasattr(part, "content"):
-                        content = part.content
-                        if not verbose and len(str(content)) > 200:
-                            content = str(content)[:200] + "..."
-                        lines.append(f"  └─ {part_type}: {content}")
-                    elif hasattr(part, "tool_name"):
-                        lines.append(
-                            f"  └─ {part_type}: {part.tool_name}({getattr(part, 'args', {})})"
-                        )
-                    else:
-                        lines.append(f"  └─ {part_type}: {part}")
-            else:
-                lines.append(f"  └─ {msg}")
+            append(f"\n[{i}] {type(msg).__name__}")
+
+            parts = getattr(msg, "parts", None)
+            if parts is None:
+                append(f"  └─ {msg}")
+                continue
+            for part in parts:
+                part_type = type(part).__name__
+                if hasattr(part, "content"):
+                    content = part.content
+                    if not verbose:
+                        # Stringify at most once; most contents already are strings
+                        text = content if isinstance(content, str) else str(content)
+                        if len(text) > 200:
+                            content = text[:200] + "..."
+                    append(f"  └─ {part_type}: {content}")
+                elif hasattr(part, "tool_name"):
+                    append(
+                        f"  └─ {part_type}: {part.tool_name}({getattr(part, 'args', {})})"
+                    )
+                else:
+                    append(f"  └─ {part_type}: {part}")
 
         return "\n".join(lines)
 
@@ -106,6 +133,94 @@ class ClassificationResult:
         print("=" * 60 + "\n")
 
 
+class _LoopLocalTransport(httpx.AsyncBaseTransport):
+    """
+    Routes each request to a connection pool owned by the running event loop.
+
+    `run_sync` runs every worker thread on its own persistent loop, and asyncio
+    connections can't be reused from a different loop than the one that opened them.
+    """
+
+    def __init__(self, **pool_options: Any):
+        self._pool_options = pool_options
+        self._pools: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        loop = asyncio.get_running_loop()
+        pool = self._pools.get(loop)
+        if pool is None:
+            with self._lock:
+                pool = self._pools.get(loop)
+                if pool is None:
+                    pool = self._pools[loop] = httpx.AsyncHTTPTransport(
+                        **self._pool_options
+                    )
+        return await pool.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            # Pools may belong to loops that are already closed
+            with suppress(Exception):
+                await pool.aclose()
+
+
+class _JsonAsyncClient(httpx.AsyncClient):
+    """Encodes JSON request bodies with orjson (when installed) instead of stdlib json."""
+
+    def build_request(
+        self, method: str, url: Any, *, json: Any = None, **kwargs: Any
+    ) -> httpx.Request:
+        if json is not None and kwargs.get("content") is None:
+            headers = httpx.Headers(kwargs.get("headers"))
+            headers.setdefault("Content-Type", "application/json")
+            kwargs["headers"] = headers
+            kwargs["content"] = json_dumps(json)
+        return super().build_request(method, url, json=None, **kwargs)
+
+
+@lru_cache(maxsize=1)
+def _shared_http_client() -> httpx.AsyncClient:
+    """
+    One HTTP client for every LLM endpoint, so all agents on a thread reuse warm
+    keep-alive (and, with `h2` installed, multiplexed HTTP/2) connections.
+    """
+    try:
+        import h2  # noqa: F401
+
+        http2 = True
+    except ImportError:
+        http2 = False
+    return _JsonAsyncClient(
+        transport=_LoopLocalTransport(
+            http2=http2,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        ),
+        timeout=httpx.Timeout(timeout=600, connect=5),
+        headers={"User-Agent": get_user_agent()},
+    )
+
+
+@atexit.register
+def _close_shared_http_client() -> None:
+    if _shared_http_client.cache_info().currsize:
+        with suppress(Exception):
+            asyncio.run(_shared_http_client().aclose())
+
+
+# Built agents keyed on their full configuration. Bounded, since batch triage
+# builds one agent per batch size.
+_AGENT_CACHE: dict[tuple[Any, ...], Agent[None, Any]] = {}
+_AGENT_CACHE_MAX = 32
+
+_AGENT_CACHE_LOCK = threading.Lock()
+
+
 @overload
 def agent_factory(
     *,
@@ -113,10 +228,12 @@ def agent_factory(
     llm_model_name: str,
     llm_api_key: str = "ollama",
     instructions: str | None = None,
-    output_type: type[TOutput],
+    output_type: OutputSpec[TOutput],
     model_settings: OpenAIChatModelSettings,
+    model_settings_key: Hashable | None = None,
     extra_tools: tuple[Callable, ...] | None = None,
     use_duckduckgo_search: bool = False,
+    native_output: bool = False,
 ) -> Agent[None, TOutput]: ...
 
 
@@ -126,30 +243,74 @@ def agent_factory(
     llm_model_name: str,
     llm_api_key: str = "ollama",
     instructions: str | None = None,
-    output_type: type[TOutput],
+    output_type: OutputSpec[TOutput],
     model_settings: OpenAIChatModelSettings,
+    model_settings_key: Hashable | None = None,
     extra_tools: tuple[Callable, ...] | None = None,
     use_duckduckgo_search: bool = False,
+    native_output: bool = False,
 ) -> Agent[None, TOutput]:
     """
     Create an agent in a consistent way across triage/research/scoring.
+
+    Agents are cached on their full configuration, so every lead handled by a
+    stage reuses the same Agent (and its model and provider) instead of
+    rebuilding them per call. `extra_tools` is part of the cache key, so pass the
+    same module-level tuple on every call. `model_settings_key` stands in for
+    `model_settings` in the key; without it the settings are keyed on their JSON
+    form. With `native_output` the output schema is sent as
+    a JSON-schema response format instead of an output tool, so backends that
+    support it constrain decoding to valid output.
     """
-    provider = OpenAIProvider(base_url=llm_base_url, api_key=llm_api_key)
-    model = OpenAIChatModel(model_name=llm_model_name, provider=provider)
-
-    tools: list[Any] = list(extra_tools) if extra_tools else []
-    if use_duckduckgo_search:
-        tools.append(duckduckgo_search_tool())
-
-    return Agent(
-        model=model,
-        output_type=output_type,
-        instructions=instructions or "",
-        retries=2,
-        end_strategy="early",
-        model_settings=model_settings,
-        tools=tools,
+    instructions = instructions or ""
+    extra_tools = extra_tools or ()
+    if model_settings_key is None:
+        # Model settings can hold nested dicts (extra_body); key on their JSON form
+        model_settings_key = json.dumps(model_settings, sort_keys=True)
+    key = (
+        llm_base_url,
+        llm_model_name,
+        llm_api_key,
+        instructions,
+        output_type,
+        model_settings_key,
+        extra_tools,
+        use_duckduckgo_search,
+        native_output,
     )
+    with _AGENT_CACHE_LOCK:
+        agent = _AGENT_CACHE.get(key)
+    if agent is None:
+        provider = OpenAIProvider(
+            base_url=llm_base_url,
+            api_key=llm_api_key,
+            http_client=_shared_http_client(),
+        )
+        model = OpenAIChatModel(model_name=llm_model_name, provider=provider)
+
+        # Agent accepts any sequence, so the caller's tuple is passed through as-is
+        tools: tuple[Any, ...] = extra_tools
+        if use_duckduckgo_search:
+            tools = (*extra_tools, duckduckgo_search_tool())
+
+        built = Agent(
+            model=model,
+            output_type=NativeOutput(output_type) if native_output else output_type,
+            instructions=instructions,
+            retries=2,
+            end_strategy="early",
+            model_settings=model_settings,
+            tools=tools,
+        )
+        with _AGENT_CACHE_LOCK:
+            # Threads racing on a cold key all end up with the first Agent stored
+            agent = _AGENT_CACHE.get(key)
+            if agent is None:
+                if len(_AGENT_CACHE) >= _AGENT_CACHE_MAX:
+                    # Evict only the oldest entry, so the other warm agents survive
+                    del _AGENT_CACHE[next(iter(_AGENT_CACHE))]
+                agent = _AGENT_CACHE[key] = built
+    return agent
 
 
 def _usage_snapshot(result: Any) -> dict[str, Any]:
@@ -171,31 +332,193 @@ def _usage_snapshot(result: Any) -> dict[str, Any]:
     }
 
 
+def _stage_model_settings(
+    settings: Settings, stage: str, *, max_tokens: int
+) -> tuple[OpenAIChatModelSettings, Hashable]:
+    """
+    Model settings for a pipeline stage, and a hashable key for `agent_factory`.
+
+    Each stage's instructions are identical for every lead, so on the OpenAI API we
+    pass a per-stage prompt cache key to route requests to the same prefix cache.
+    With LLM_CACHE_PROMPT, other servers are asked to retain the prompt prefix
+    across requests.
+
+    The settings are memoized and shared by every caller, so treat them as read-only.
+    """
+    key = (settings.llm_base_url, settings.llm_cache_prompt, stage, max_tokens)
+    return _build_stage_model_settings(*key), key
+
+
+# Unbounded, but only grows with distinct stages and triage batch sizes
+@lru_cache(maxsize=None)
+def _build_stage_model_settings(
+    llm_base_url: str, cache_prompt: bool, stage: str, max_tokens: int
+) -> OpenAIChatModelSettings:
+    model_settings = OpenAIChatModelSettings(temperature=0.0, max_tokens=max_tokens)
+    if urlparse(llm_base_url).hostname == "api.openai.com":
+        model_settings["openai_prompt_cache_key"] = f"leads-agent-{stage}"
+    elif cache_prompt:
+        # llama.cpp-style servers only keep the prompt's KV cache when asked to.
+        # Opt-in: strict OpenAI-compatible APIs reject unknown body fields with a 400
+        model_settings["extra_body"] = {"cache_prompt": True}
+    return model_settings
+
+
+def warm_up_model(settings: Settings) -> None:
+    """
+    Send a 1-token request so backends that load models on demand (e.g. Ollama)
+    have the model in memory before the first real lead.
+
+    This doesn't warm the workers' connections: HTTP pools are per event loop,
+    and this request runs on its own.
+    """
+    api_key = (
+        settings.openai_api_key.get_secret_value()
+        if settings.openai_api_key
+        else "ollama"
+    )
+    agent = agent_factory(
+        llm_base_url=settings.llm_base_url,
+        llm_model_name=settings.llm_model_name,
+        llm_api_key=api_key,
+        output_type=str,
+        model_settings=OpenAIChatModelSettings(temperature=0.0, max_tokens=1),
+    )
+    agent.run_sync("ping")
+
+
 def _create_triage_agent(
     settings: Settings, api_key: str
 ) -> Agent[None, LeadClassification]:
     pm = get_prompt_manager()
+    model_settings, settings_key = _stage_model_settings(
+        settings, "triage", max_tokens=900
+    )
     return agent_factory(
         llm_base_url=settings.llm_base_url,
         llm_model_name=settings.llm_model_name,
         llm_api_key=api_key,
         instructions=pm.build_triage_prompt(),
         output_type=LeadClassification,
-        model_settings=OpenAIChatModelSettings(temperature=0.0, max_tokens=900),
+        native_output=settings.llm_native_output,
+        model_settings=model_settings,
+        model_settings_key=settings_key,
+    )
+
+
+_BATCH_TRIAGE_INSTRUCTIONS = """
+
+## Batch Mode
+You will receive several leads, each under a "### Lead N" heading.
+Classify every lead independently and return exactly one item per lead, with
+`lead` set to that lead's number N.
+"""
+
+
+class _BatchTriageItem(BaseModel):
+    """One lead's result in a batched triage response."""
+
+    lead: int = Field(description='The N from the lead\'s "### Lead N" heading')
+    classification: LeadClassification
+
+
+def _create_batch_triage_agent(
+    settings: Settings, api_key: str, batch_size: int
+) -> Agent[None, list[_BatchTriageItem]]:
+    pm = get_prompt_manager()
+    model_settings, settings_key = _stage_model_settings(
+        settings, "triage-batch", max_tokens=900 * batch_size
+    )
+    return agent_factory(
+        llm_base_url=settings.llm_base_url,
+        llm_model_name=settings.llm_model_name,
+        llm_api_key=api_key,
+        instructions=pm.build_triage_prompt() + _BATCH_TRIAGE_INSTRUCTIONS,
+        output_type=list[_BatchTriageItem],
+        native_output=settings.llm_native_output,
+        model_settings=model_settings,
+        model_settings_key=settings_key,
     )
 
 
+def triage_leads(
+    settings: Settings, prompts: list[str]
+) -> list[LeadClassification | BaseException]:
+    """
+    Triage several leads with a single LLM request.
+
+    Each batched result must name the lead it belongs to; leads whose result is
+    missing, duplicated or out of range (or the whole batch, if the request
+    fails) are re-triaged with concurrent per-lead requests. A lead whose own
+    request fails gets its exception in place of a result, so one bad lead
+    doesn't fail the rest of its batch.
+    """
+    api_key = (
+        settings.openai_api_key.get_secret_value()
+        if settings.openai_api_key
+        else "ollama"
+    )
+    matched: dict[int, LeadClassification] = {}
+    if len(prompts) > 1:
+        batch_prompt = "\n\n".join(
+            f"### Lead {i}\n{prompt.strip()}" for i, prompt in enumerate(prompts, 1)
+        )
+        try:
+            batch_agent = _create_batch_triage_agent(settings, api_key, len(prompts))
+            items = batch_agent.run_sync(batch_prompt).output
+        except Exception as e:
+            logger.warning(
+                f"Batched triage of {len(prompts)} leads failed, "
+                f"triaging individually: {e!r}"
+            )
+            items = []
+        counts = Counter(item.lead for item in items)
+        matched = {
+            item.lead - 1: item.classification
+            for item in items
+            if counts[item.lead] == 1 and 1 <= item.lead <= len(prompts)
+        }
+        if items and len(matched) < len(prompts):
+            logger.warning(
+                f"Batched triage matched {len(matched)} of {len(prompts)} leads, "
+                "triaging the rest individually"
+            )
+
+    missing = [i for i in range(len(prompts)) if i not in matched]
+    results: list[LeadClassification | BaseException] = [
+        matched.get(i) for i in range(len(prompts))
+    ]
+    if missing:
+        triage_agent = _create_triage_agent(settings, api_key)
+
+        async def triage_each() -> list[Any]:
+            return await asyncio.gather(
+                *(triage_agent.run(prompts[i]) for i in missing),
+                return_exceptions=True,
+            )
+
+        runs = _run_sync(triage_each())
+        for i, run in zip(missing, runs):
+            results[i] = run if isinstance(run, BaseException) else run.output
+    return results
+
+
 def _create_research_agent(
     settings: Settings, api_key: str
 ) -> Agent[None, EnrichedLeadClassification]:
     pm = get_prompt_manager()
+    model_settings, settings_key = _stage_model_settings(
+        settings, "research", max_tokens=8000
+    )
     return agent_factory(
         llm_base_url=settings.llm_base_url,
         llm_model_name=settings.llm_model_name,
         llm_api_key=api_key,
         instructions=pm.build_research_prompt(),
         output_type=EnrichedLeadClassification,
-        model_settings=OpenAIChatModelSettings(temperature=0.0, max_tokens=8000),
+        native_output=settings.llm_native_output,
+        model_settings=model_settings,
+        model_settings_key=settings_key,
         use_duckduckgo_search=True,
     )
 
@@ -204,26 +527,152 @@ def _create_scoring_agent(
     settings: Settings, api_key: str
 ) -> Agent[None, EnrichedLeadClassification]:
     pm = get_prompt_manager()
+    model_settings, settings_key = _stage_model_settings(
+        settings, "scoring", max_tokens=2500
+    )
     return agent_factory(
         llm_base_url=settings.llm_base_url,
         llm_model_name=settings.llm_model_name,
         llm_api_key=api_key,
         instructions=pm.build_scoring_prompt(),
         output_type=EnrichedLeadClassification,
-        model_settings=OpenAIChatModelSettings(temperature=0.0, max_tokens=2500),
+        native_output=settings.llm_native_output,
+        model_settings=model_settings,
+        model_settings_key=settings_key,
+    )
+
+
+# Rules for leads that are never worth an LLM call (ENABLE_PREFILTER). Each one
+# matches solicitation phrasing, not topics, since prospects can mention SEO or
+# say "we offer ..." about their own business.
+_PREFILTER_RULES = (
+    (
+        re.compile(
+            r"\b(?:buy|sell|selling|offer|offering|provide|providing|cheap|affordable)"
+            r"\s+(?:high[- ]quality\s+|quality\s+|do-?follow\s+)?"
+            r"(?:backlinks|guest posts|SEO services|link building services)\b",
+            re.I,
+        ),
+        "rule: link/SEO selling",
+    ),
+    (
+        re.compile(
+            r"\b(?:rank|get)\s+your\s+(?:website|site)\s+(?:on|to)\s+"
+            r"(?:the\s+)?(?:first|top|1st)\s+page\b",
+            re.I,
+        ),
+        "rule: ranking pitch",
+    ),
+    (
+        re.compile(r"\bguest post(?:ing)?\s+on\s+your\s+(?:site|blog|website)\b", re.I),
+        "rule: guest post request",
+    ),
+    (
+        re.compile(r"\b(?:crypto|NFT)\s+(?:investment|trading)\s+opportunit\w*", re.I),
+        "rule: crypto solicitation",
+    ),
+    (
+        re.compile(
+            r"\b(?:we are|we're)\s+an?\s+(?:\w+\s+){0,2}"
+            r"(?:digital marketing|SEO|lead generation|outsourcing|staffing)\s+"
+            r"(?:agency|company|firm)\b.{0,80}\b(?:help|offer|provide)\s+you",
+            re.I | re.S,
+        ),
+        "rule: vendor solicitation",
+    ),
+)
+
+
+def _prefilter_lead(lead: HubSpotLead) -> LeadClassification | None:
+    """Return an `ignore` classification if the lead matches a prefilter rule."""
+    text = lead.message or lead.raw_text
+    for pattern, reason in _PREFILTER_RULES:
+        match = pattern.search(text)
+        if match is not None:
+            logger.info(
+                f"Prefilter ignored lead {lead.email or lead.company or '?'}: "
+                f"{reason} matched {match.group(0)!r}"
+            )
+            return LeadClassification.model_construct(
+                first_name=lead.first_name,
+                last_name=lead.last_name,
+                email=lead.email,
+                company=lead.company,
+                label=LeadLabel.ignore,
+                confidence=0.99,
+                reason=f"{reason} ({match.group(0)!r})",
+            )
+    return None
+
+
+def _response_cache_key(settings: Settings, prompt: str, max_searches: int) -> str:
+    """Cache key covering everything that shapes the pipeline output for a lead."""
+    return cache_key(
+        settings.llm_base_url,
+        settings.llm_model_name,
+        get_prompt_manager().config_fingerprint,
+        str(max_searches),
+        normalize_text(prompt),
     )
 
 
+def _run_sync(coro: Coroutine[Any, Any, TOutput]) -> TOutput:
+    """
+    Run a coroutine to completion on this thread's persistent event loop.
+
+    Mirrors `Agent.run_sync`: reusing one loop per thread keeps the shared async
+    HTTP client's pooled connections valid across calls (`asyncio.run` would
+    close the loop they're bound to).
+    """
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    return loop.run_until_complete(coro)
+
+
 def classify_lead(
     settings: Settings,
     lead: HubSpotLead,
     *,
     debug: bool = False,
     max_searches: int = 4,
+    triage_batcher: TriageBatcher | None = None,
+) -> LeadClassification | EnrichedLeadClassification | ClassificationResult:
+    """Synchronous wrapper around `classify_lead_async` (CLI, Bolt handlers, threads)."""
+    return _run_sync(
+        classify_lead_async(
+            settings,
+            lead,
+            debug=debug,
+            max_searches=max_searches,
+            triage_batcher=triage_batcher,
+        )
+    )
+
+
+async def classify_lead_async(
+    settings: Settings,
+    lead: HubSpotLead,
+    *,
+    debug: bool = False,
+    max_searches: int = 4,
+    triage_batcher: TriageBatcher | None = None,
 ) -> LeadClassification | EnrichedLeadClassification | ClassificationResult:
     """
     Classify a HubSpot lead using a multi-stage pipeline:
     triage → (if promising) web research → (if promising) final 1–5 scoring.
+
+    Each stage's system prompt is built only from the prompt configuration and is
+    byte-identical across leads; all lead data goes in the user prompt. Keep it
+    that way so provider-side prompt caches can skip re-processing the prefix.
+
+    Results are cached on the normalized lead text, so duplicates (e.g. spam blasts)
+    skip the LLM entirely. Debug runs bypass the cache to capture message history.
+
+    With a `triage_batcher`, the triage stage is coalesced with other concurrent
+    leads into a single LLM request (debug runs always triage individually).
     """
     # Ensure there is a stable parent span even when classify_lead is called directly
     # (e.g., CLI/backtest). When invoked under an existing span (e.g., Slack processing),
@@ -259,21 +708,42 @@ def classify_lead(
             else "ollama"
         )
 
-        triage_agent = _create_triage_agent(settings, api_key)
+        if settings.enable_prefilter:
+            prefiltered = _prefilter_lead(lead)
+            if prefiltered is not None:
+                if debug:
+                    return ClassificationResult(classification=prefiltered)
+                return prefiltered
+
         prompt = lead.to_prompt_text()
-        triage_run = triage_agent.run_sync(prompt)
-        triage = triage_run.output
+        cache = get_response_cache(
+            settings.response_cache_size, settings.response_cache_path
+        )
+        cache_id = _response_cache_key(settings, prompt, max_searches)
+        if not debug:
+            cached = cache.get(cache_id)
+            if cached is not None:
+                return cached
 
-        final: LeadClassification | EnrichedLeadClassification = triage
         message_history: list[ModelMessage] = []
-        usage: dict[str, Any] = {"triage": _usage_snapshot(triage_run)}
-        try:
-            message_history.extend(triage_run.all_messages())
-        except Exception:
-            pass
+        usage: dict[str, Any] = {}
+        if triage_batcher is not None and not debug:
+            # History/usage belong to the shared batch request, not to this lead
+            triage = await asyncio.wrap_future(triage_batcher.submit(prompt))
+        else:
+            triage_agent = _create_triage_agent(settings, api_key)
+            triage_run = await triage_agent.run(prompt)
+            triage = triage_run.output
+            usage["triage"] = _usage_snapshot(triage_run)
+            try:
+                message_history.extend(triage_run.all_messages())
+            except Exception:
+                pass
+
+        final: LeadClassification | EnrichedLeadClassification = triage
 
         if triage.label.value == "promising":
-            enriched, research_msgs, research_usage = _research_lead(
+            enriched, research_msgs, research_usage = await _research_lead(
                 settings, lead, triage, max_searches=max_searches, return_debug=True
             )
             if research_msgs:
@@ -281,7 +751,7 @@ def classify_lead(
             if research_usage:
                 usage["research"] = research_usage
 
-            scored, scoring_msgs, scoring_usage = _score_lead(
+            scored, scoring_msgs, scoring_usage = await _score_lead(
                 settings,
                 lead,
                 triage=triage,
@@ -294,6 +764,10 @@ def classify_lead(
             if scoring_usage:
                 usage["scoring"] = scoring_usage
 
+        # Don't cache results degraded by a failed research step
+        if "error" not in usage.get("research", {}):
+            cache.set(cache_id, final)
+
         if debug:
             return ClassificationResult(
                 classification=final,
@@ -303,7 +777,7 @@ def classify_lead(
         return final
 
 
-def _research_lead(
+async def _research_lead(
     settings: Settings,
     lead: HubSpotLead,
     classification: LeadClassification,
@@ -361,7 +835,7 @@ Return an enriched classification with your research findings.
 """
 
     try:
-        run = research_agent.run_sync(research_prompt)
+        run = await research_agent.run(research_prompt)
         output = run.output
         if return_debug:
             return output, run.all_messages(), _usage_snapshot(run)
@@ -384,7 +858,7 @@ Return an enriched classification with your research findings.
         return fallback
 
 
-def _score_lead(
+async def _score_lead(
     settings: Settings,
     lead: HubSpotLead,
     *,
@@ -426,7 +900,7 @@ Research output (if any):
 {enriched.model_dump_json(indent=2, exclude_none=True) if enriched is not None else "None"}
 """
 
-    run = scoring_agent.run_sync(scoring_input)
+    run = await scoring_agent.run(scoring_input)
     output = run.output
     if return_debug:
         return output, run.all_messages(), _usage_snapshot(run)
@@ -441,5 +915,20 @@ def classify_message(
     max_searches: int = 4,
 ) -> LeadClassification | EnrichedLeadClassification | ClassificationResult:
     """Classify a raw message text using the same pipeline as classify_lead()."""
-    lead = HubSpotLead(raw_text=text, message=text)
+    # Both fields are plain strings, so there is nothing for validation to check
+    lead = HubSpotLead.model_construct(raw_text=text, message=text)
     return classify_lead(settings, lead, debug=debug, max_searches=max_searches)
+
+
+async def classify_message_async(
+    settings: Settings,
+    text: str,
+    *,
+    debug: bool = False,
+    max_searches: int = 4,
+) -> LeadClassification | EnrichedLeadClassification | ClassificationResult:
+    """Async variant of classify_message()."""
+    lead = HubSpotLead.model_construct(raw_text=text, message=text)
+    return await classify_lead_async(
+        settings, lead, debug=debug, max_searches=max_searches
+    )
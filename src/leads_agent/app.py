@@ -1,5 +1,9 @@
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
@@ -9,9 +13,12 @@ from rich.logging import RichHandler
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
 
+from leads_agent.agent import warm_up_model
+from leads_agent.batcher import create_triage_batcher
 from leads_agent.config import Settings, get_settings
 from leads_agent.core.processor import process_and_post
 from leads_agent.models import HubSpotLead
+from leads_agent.slack import is_hubspot_lead_event
 
 if TYPE_CHECKING:
     from slack_bolt.context.say import Say
@@ -52,22 +59,65 @@ def _is_hubspot_message(settings: Settings, event: dict) -> bool:
     if settings.debug:
         console.print("[bold cyan]Event:[/]")
         console.print(event)
-    # Must be a bot_message subtype
-    if event.get("subtype") != "bot_message":
-        return False
-    # Must be from HubSpot
-    if event.get("username", "").lower() != "hubspot":
-        return False
-    # Skip thread replies (only process top-level messages)
-    if event.get("thread_ts") and event.get("thread_ts") != event.get("ts"):
-        return False
-    # Must have attachments (where HubSpot puts lead data)
-    if not event.get("attachments"):
-        return False
-    # Filter by channel if configured
-    if settings.slack_channel_id and event.get("channel") != settings.slack_channel_id:
-        return False
-    return True
+    return is_hubspot_lead_event(event, settings.slack_channel_id)
+
+
+class _RecentEvents:
+    """
+    Thread-safe TTL set of recently handled event keys.
+
+    Slack may deliver the same message more than once (retries, reconnects);
+    handlers use this to classify and reply to each lead only once.
+    """
+
+    def __init__(self, ttl: float = 600.0, maxsize: int = 10_000):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._expires: OrderedDict[tuple, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def first_seen(self, key: tuple) -> bool:
+        """Record `key`; return False if it was already seen within the TTL."""
+        now = time.monotonic()
+        with self._lock:
+            # Entries share one TTL, so the oldest (first) entries expire first
+            while self._expires and (
+                next(iter(self._expires.values())) <= now
+                or len(self._expires) >= self.maxsize
+            ):
+                self._expires.popitem(last=False)
+            if key in self._expires:
+                return False
+            self._expires[key] = now + self.ttl
+            return True
+
+
+def _lead_worker_pool(settings: Settings) -> ThreadPoolExecutor:
+    """
+    Executor that runs message listeners in the background.
+
+    Bolt acknowledges events before handing them to this pool, so slow LLM calls
+    and Slack posts never hold up event dispatch (or trigger Slack retries).
+    """
+    return ThreadPoolExecutor(
+        max_workers=max(1, settings.worker_concurrency),
+        thread_name_prefix="leads-worker",
+    )
+
+
+def _warm_up_in_background(settings: Settings) -> None:
+    """Load the LLM model on the backend while Socket Mode connects."""
+    if not settings.llm_warmup:
+        return
+
+    def run():
+        try:
+            warm_up_model(settings)
+            logger.info("LLM warm-up complete")
+        except Exception as e:
+            logger.warning(f"LLM warm-up failed: {e}")
+
+    threading.Thread(target=run, name="llm-warmup", daemon=True).start()
 
 
 def create_bolt_app(settings: Settings | None = None) -> App:
@@ -86,7 +136,10 @@ def create_bolt_app(settings: Settings | None = None) -> App:
     app = App(
         token=settings.slack_bot_token.get_secret_value(),
         # No signing_secret needed for Socket Mode
+        listener_executor=_lead_worker_pool(settings),
     )
+    triage_batcher = create_triage_batcher(settings)
+    recent_events = _RecentEvents()
 
     @app.event("message")
     def handle_message(event: dict, say: "Say", client: "WebClient"):
@@ -95,6 +148,9 @@ def create_bolt_app(settings: Settings | None = None) -> App:
             return
 
         channel = event.get("channel", "unknown")
+        if not recent_events.first_seen((channel, event.get("ts"))):
+            logger.info(f"Skipping duplicate delivery of {event.get('ts')}")
+            return
         logger.info(f"HubSpot lead detected in {channel}")
 
         lead = HubSpotLead.from_slack_event(event)
@@ -118,6 +174,7 @@ def create_bolt_app(settings: Settings | None = None) -> App:
                 lead,
                 channel_id=channel,
                 thread_ts=event["ts"],
+                triage_batcher=triage_batcher,
             )
 
             logger.info(
@@ -157,6 +214,7 @@ def run_socket_mode(settings: Settings | None = None) -> None:
     print(f"  Dry run: {settings.dry_run}")
     print("\nListening for HubSpot messages... (Ctrl+C to stop)\n")
 
+    _warm_up_in_background(settings)
     handler.start()
 
 
@@ -179,7 +237,10 @@ def run_test_mode(
 
     app = App(
         token=settings.slack_bot_token.get_secret_value(),
+        listener_executor=_lead_worker_pool(settings),
     )
+    triage_batcher = create_triage_batcher(settings)
+    recent_events = _RecentEvents()
 
     @app.event("message")
     def handle_message(event: dict, say: "Say", client: "WebClient"):
@@ -188,6 +249,9 @@ def run_test_mode(
             return
 
         channel = event.get("channel", "unknown")
+        if not recent_events.first_seen((channel, event.get("ts"))):
+            logger.info(f"Skipping duplicate delivery of {event.get('ts')}")
+            return
         logger.info(f"HubSpot lead detected in {channel}")
 
         lead = HubSpotLead.from_slack_event(event)
@@ -213,6 +277,7 @@ def run_test_mode(
                 thread_ts=None,  # Not as a thread reply
                 max_searches=max_searches,
                 include_lead_info=True,  # Include lead details
+                triage_batcher=triage_batcher,
             )
 
             logger.info(
@@ -240,24 +305,25 @@ def run_test_mode(
     print(f"  Dry run: {settings.dry_run}")
     print("\nWaiting for HubSpot messages... (Ctrl+C to stop)\n")
 
+    _warm_up_in_background(settings)
     handler.start()
 
 
 def collect_events(
     settings: Settings | None = None,
     keep: int = 20,
-    output_file: str = "collected_events.json",
+    output_file: str = "collected_events.jsonl",
 ) -> None:
     """
     Collect raw Socket Mode events for debugging/inspection.
 
-    Saves the complete raw payload for each event to a JSON file.
+    Appends the complete raw payload for each event to a JSON Lines file as it
+    arrives, so nothing is lost on Ctrl+C and each save is O(1).
     Stops after collecting `keep` events or on Ctrl+C.
     """
-    import json
-    import threading
     from pathlib import Path
-    from time import sleep
+
+    from leads_agent.common import json_dumps_line
 
     from slack_sdk.socket_mode import SocketModeClient
     from slack_sdk.socket_mode.request import SocketModeRequest
@@ -266,25 +332,17 @@ def collect_events(
     settings = settings or get_settings()
     settings.require_slack_socket_mode()
 
-    collected: list[dict] = []
+    output_path = Path(output_file)
+    if output_path.suffix != ".jsonl":
+        output_path = output_path.with_suffix(".jsonl")
+
+    count = 0
     lock = threading.Lock()
     should_stop = threading.Event()
 
-    def save_events():
-        """Save collected events to file (thread-safe)."""
-        with lock:
-            if not collected:
-                return
-            try:
-                Path(output_file).write_text(
-                    json.dumps(collected, indent=2, default=str)
-                )
-                print(f"\n[SAVED] {len(collected)} events to {output_file}")
-            except Exception as e:
-                print(f"\n[ERROR] Failed to save events: {e}")
-
     def handle_socket_mode_request(client: SocketModeClient, req: SocketModeRequest):
         """Capture every raw Socket Mode request."""
+        nonlocal count
         try:
             # Acknowledge immediately
             client.send_socket_mode_response(
@@ -307,8 +365,12 @@ def collect_events(
             }
 
             with lock:
-                collected.append(event_data)
-                count = len(collected)
+                if count >= keep:
+                    return
+                out.write(json_dumps_line(event_data))
+                out.flush()
+                count += 1
+                seen = count
 
             # Log with more detail
             event_type = req.type
@@ -322,17 +384,12 @@ def collect_events(
                         event_type = f"{event_type}/{event_type_detail}"
 
             print(
-                f"[{count}/{keep}] type={event_type}"
+                f"[{seen}/{keep}] type={event_type}"
                 + (f" subtype={event_subtype}" if event_subtype else "")
             )
 
-            # Save periodically (every 5 events) to avoid data loss
-            if count % 5 == 0:
-                save_events()
-
             # Check if we've reached the target
-            if count >= keep:
-                save_events()
+            if seen >= keep:
                 print("\n[DONE] Reached target count.")
                 should_stop.set()
                 return
@@ -349,39 +406,40 @@ def collect_events(
     )
     client.socket_mode_request_listeners.append(handle_socket_mode_request)
 
-    print("\n[COLLECT] Listening for raw Socket Mode events")
-    print(f"  Target: {keep} events")
-    print(f"  Output: {output_file}")
-    print("  Auto-save: Every 5 events")
-    print("\nWaiting for events... (Ctrl+C to stop early)\n")
+    # Opened only once the client exists; the handler writes through `out`, and
+    # the with block closes it on every exit path
+    with output_path.open("wb") as out:
+        print("\n[COLLECT] Listening for raw Socket Mode events")
+        print(f"  Target: {keep} events")
+        print(f"  Output: {output_path}")
+        print("  Auto-save: Every event (JSON Lines)")
+        print("\nWaiting for events... (Ctrl+C to stop early)\n")
 
-    try:
-        client.connect()
-        # Wait until we should stop (either target reached or interrupted)
-        while not should_stop.is_set():
-            sleep(0.5)
-            # Check connection health
-            if not client.is_connected():
-                print("\n[WARNING] Socket Mode connection lost. Reconnecting...")
-                try:
-                    client.connect()
-                except Exception as e:
-                    print(f"[ERROR] Failed to reconnect: {e}")
-                    break
-    except KeyboardInterrupt:
-        print("\n[INTERRUPTED] Saving collected events...")
-        save_events()
-        print("\n[INTERRUPTED] Saved partial collection.")
-    except Exception as e:
-        print(f"\n[ERROR] Unexpected error: {e}")
-        import traceback
-
-        traceback.print_exc()
-        save_events()
-    finally:
-        # Final save to ensure nothing is lost
-        save_events()
         try:
-            client.close()
-        except Exception:
-            pass
+            client.connect()
+            # Block until the handler signals the target was reached (or Ctrl+C),
+            # waking periodically only to check connection health
+            while not should_stop.wait(timeout=5.0):
+                if not client.is_connected():
+                    print("\n[WARNING] Socket Mode connection lost. Reconnecting...")
+                    try:
+                        client.connect()
+                    except Exception as e:
+                        print(f"[ERROR] Failed to reconnect: {e}")
+                        break
+        except KeyboardInterrupt:
+            print("\n[INTERRUPTED] Saved partial collection.")
+        except Exception as e:
+            print(f"\n[ERROR] Unexpected error: {e}")
+            import traceback
+
+            traceback.print_exc()
+        finally:
+            try:
+                client.close()
+            except Exception:
+                pass
+            with lock:
+                out.close()
+                if count:
+                    print(f"\n[SAVED] {count} events to {output_path}")
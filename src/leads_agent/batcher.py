@@ -0,0 +1,128 @@
+"""Micro-batching of triage calls, so bursts of leads share one LLM request."""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from leads_agent.agent import triage_leads
+from leads_agent.config import Settings
+from leads_agent.models import LeadClassification
+
+
+class TriageBatcher:
+    """
+    Coalesces concurrent triage requests into batched LLM calls.
+
+    Callers block in `triage()` while a collector thread gathers prompts for up to
+    `window_ms` (or until `max_batch` are queued), then classifies the whole batch
+    with a single request and hands each caller its own result.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        *,
+        max_batch: int = 8,
+        window_ms: int = 250,
+        max_inflight: int = 4,
+    ):
+        self.settings = settings
+        self.max_batch = max(1, max_batch)
+        self.window = max(0, window_ms) / 1000
+        self._queue: queue.Queue[tuple[str, Future[LeadClassification]]] = queue.Queue()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_inflight), thread_name_prefix="triage-batch"
+        )
+        self._collector: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, prompt: str) -> Future[LeadClassification]:
+        """
+        Queue a triage prompt; the future resolves once its batch completes.
+
+        Raises RuntimeError after `close()`, since nothing would consume the prompt.
+        """
+        future: Future[LeadClassification] = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("TriageBatcher is closed")
+            self._queue.put((prompt, future))
+            if self._collector is None:
+                self._collector = threading.Thread(
+                    target=self._collect, name="triage-batcher", daemon=True
+                )
+                self._collector.start()
+        return future
+
+    def triage(self, prompt: str) -> LeadClassification:
+        """Triage a single prompt as part of the next batch (blocking)."""
+        return self.submit(prompt).result()
+
+    def close(self) -> None:
+        """Stop accepting work once already-queued prompts have been dispatched."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._collector is None:
+                self._executor.shutdown(wait=False)
+                return
+            self._queue.put(None)
+
+    def _next_batch(self) -> tuple[list[tuple[str, Future[LeadClassification]]], bool]:
+        """Collect the next batch; the flag is True once `close()` was called."""
+        item = self._queue.get()
+        if item is None:
+            return [], True
+        batch = [item]
+        deadline = time.monotonic() + self.window
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _collect(self) -> None:
+        while True:
+            batch, closed = self._next_batch()
+            if batch:
+                self._executor.submit(self._run_batch, batch)
+            if closed:
+                self._executor.shutdown(wait=False)
+                return
+
+    def _run_batch(self, batch: list[tuple[str, Future[LeadClassification]]]) -> None:
+        try:
+            results = triage_leads(self.settings, [prompt for prompt, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        # Each caller gets its own lead's outcome, failed or not
+        for (_, future), result in zip(batch, results):
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+def create_triage_batcher(settings: Settings) -> TriageBatcher | None:
+    """Create a batcher from settings, or None when batching is disabled."""
+    if settings.triage_batch_size <= 1:
+        return None
+    return TriageBatcher(
+        settings,
+        max_batch=settings.triage_batch_size,
+        window_ms=settings.triage_batch_window_ms,
+    )
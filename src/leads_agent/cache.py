@@ -0,0 +1,160 @@
+"""Cache of classification results, keyed on normalized lead text."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from pydantic import TypeAdapter
+
+from leads_agent.common import json_loads
+from leads_agent.models import EnrichedLeadClassification, LeadClassification
+
+_MODEL_TYPES: dict[str, type[LeadClassification]] = {
+    cls.__name__: cls for cls in (LeadClassification, EnrichedLeadClassification)
+}
+# Built once at import so cache writes never rebuild serialization schemas
+_ADAPTERS: dict[str, TypeAdapter[LeadClassification]] = {
+    name: TypeAdapter(cls) for name, cls in _MODEL_TYPES.items()
+}
+
+# Trim the on-disk store back to `maxsize` after this many writes
+_PRUNE_EVERY = 256
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase and collapse whitespace so trivially different copies share a key."""
+    return " ".join(text.lower().split())
+
+
+def cache_key(*parts: str) -> str:
+    """Build a stable cache key from its parts."""
+    return hashlib.blake2b(
+        "\x1f".join(parts).encode("utf-8"), digest_size=20
+    ).hexdigest()
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache of classification results.
+
+    Entries are stored serialized, so every hit returns a fresh model instance.
+    With a `path`, entries are also written through to a SQLite file so hits
+    survive restarts. A `maxsize` of 0 disables caching.
+    """
+
+    def __init__(self, maxsize: int = 4096, path: str | Path | None = None):
+        self.maxsize = maxsize
+        self.path = Path(path).expanduser() if path is not None else None
+        self._entries: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        self._writes = 0
+        if self.path is not None and maxsize > 0:
+            self._db = _open_db(self.path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> LeadClassification | EnrichedLeadClassification | None:
+        """Return the cached classification for `key`, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            elif self._db is not None:
+                row = self._db.execute(
+                    "SELECT type, data FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                entry = (row[0], row[1])
+                self._remember(key, entry)
+            else:
+                return None
+        type_name, raw = entry
+        # Entries were validated before they were stored, so skip re-validation
+        return _MODEL_TYPES[type_name].from_trusted(json_loads(raw))
+
+    def set(
+        self, key: str, classification: LeadClassification | EnrichedLeadClassification
+    ) -> None:
+        """Store a classification, evicting the least recently used entries."""
+        if self.maxsize <= 0:
+            return
+        type_name = type(classification).__name__
+        entry = (type_name, _ADAPTERS[type_name].dump_json(classification))
+        with self._lock:
+            self._remember(key, entry)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO entries (key, type, data) VALUES (?, ?, ?)",
+                    (key, *entry),
+                )
+                self._writes += 1
+                if self._writes % _PRUNE_EVERY == 0:
+                    self._db.execute(
+                        "DELETE FROM entries WHERE rowid NOT IN "
+                        "(SELECT rowid FROM entries ORDER BY rowid DESC LIMIT ?)",
+                        (self.maxsize,),
+                    )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM entries")
+
+    def _remember(self, key: str, entry: tuple[str, bytes]) -> None:
+        # Caller holds the lock
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+def _open_db(path: Path) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Access is serialized by ResponseCache's lock; autocommit each statement
+    db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute(
+        "CREATE TABLE IF NOT EXISTS entries "
+        "(key TEXT PRIMARY KEY, type TEXT NOT NULL, data BLOB NOT NULL)"
+    )
+    return db
+
+
+# Global response cache instance
+_response_cache: ResponseCache | None = None
+
+
+def get_response_cache(
+    maxsize: int = 4096, path: str | Path | None = None
+) -> ResponseCache:
+    """
+    Get or create the global response cache.
+
+    Raises ValueError if the cache already exists with a different size or path;
+    call `reset_response_cache()` first to reconfigure it.
+    """
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache(maxsize, path)
+        return _response_cache
+    resolved = Path(path).expanduser() if path is not None else None
+    if (_response_cache.maxsize, _response_cache.path) != (maxsize, resolved):
+        raise ValueError(
+            "Response cache already created with "
+            f"maxsize={_response_cache.maxsize}, path={_response_cache.path}"
+        )
+    return _response_cache
+
+
+def reset_response_cache() -> None:
+    """Reset the global response cache (useful for testing)."""
+    global _response_cache
+    _response_cache = None
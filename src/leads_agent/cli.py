@@ -2,18 +2,14 @@ from pathlib import Path
 
 import typer
 from rich import print as rprint
-from rich.console import Console
 from rich.panel import Panel
 
-from leads_agent.config import get_settings
-
 app = typer.Typer(
     name="leads-agent",
     help="🧠 AI-powered Slack lead classifier",
     add_completion=False,
     rich_markup_mode="rich",
 )
-console = Console()
 
 
 @app.command(name="init")
@@ -73,13 +69,13 @@ def run_command():
 def collect(
     keep: int = typer.Option(20, "--keep", "-n", help="Number of events to collect"),
     output: str = typer.Option(
-        "collected_events.json", "--output", "-o", help="Output JSON file"
+        "collected_events.jsonl", "--output", "-o", help="Output JSON Lines file"
     ),
 ):
     """
     Collect raw Socket Mode events for debugging.
 
-    Saves raw event payloads exactly as received from Slack.
+    Appends raw event payloads exactly as received from Slack, one per line.
     Useful for inspecting event format and structure.
     """
     from leads_agent.app import collect_events
@@ -95,7 +91,8 @@ def collect(
 @app.command(name="backtest")
 def backtest_command(
     events_file: Path = typer.Argument(
-        ..., help="JSON file with collected events (from `collect` command)"
+        ...,
+        help="JSONL (or JSON array) file with collected events (from `collect` command)",
     ),
     limit: int = typer.Option(
         None, "--limit", "-n", help="Max number of leads to process"
@@ -103,6 +100,9 @@ def backtest_command(
     max_searches: int = typer.Option(
         4, "--max-searches", help="Max web searches per lead"
     ),
+    concurrency: int = typer.Option(
+        4, "--concurrency", "-c", help="Max leads classified in parallel"
+    ),
     debug: bool = typer.Option(
         False, "--debug", "-d", help="Show agent steps and token usage"
     ),
@@ -114,7 +114,7 @@ def backtest_command(
     Run classifier on collected events (console output only).
 
     First collect events with: leads-agent collect --keep 20
-    Then backtest with: leads-agent backtest collected_events.json
+    Then backtest with: leads-agent backtest collected_events.jsonl
     """
     from leads_agent.core import run_backtest
 
@@ -131,6 +131,7 @@ def backtest_command(
         max_searches=max_searches,
         debug=debug,
         verbose=verbose,
+        concurrency=concurrency,
     )
 
 
@@ -155,12 +156,13 @@ def test(
     Respects DRY_RUN config setting. Use --dry-run or --live to override.
     """
     from leads_agent.app import run_test_mode
+    from leads_agent.config import get_settings
 
     settings = get_settings()
 
     # Override dry_run if explicitly set
     if dry_run is not None:
-        settings.dry_run = dry_run
+        settings = settings.model_copy(update={"dry_run": dry_run})
 
     # Determine test channel
     target_channel = test_channel or settings.slack_test_channel_id
@@ -216,6 +218,9 @@ def replay_command(
     max_searches: int = typer.Option(
         4, "--max-searches", help="Max web searches per lead"
     ),
+    concurrency: int = typer.Option(
+        4, "--concurrency", help="Max leads processed in parallel"
+    ),
 ):
     """
     Replay HubSpot lead messages from Slack channel history.
@@ -227,7 +232,11 @@ def replay_command(
     from leads_agent.core import replay
 
     replay(
-        channel_id=channel_id, limit=limit, dry_run=dry_run, max_searches=max_searches
+        channel_id=channel_id,
+        limit=limit,
+        dry_run=dry_run,
+        max_searches=max_searches,
+        concurrency=concurrency,
     )
 
 
@@ -252,6 +261,9 @@ def classify_command(
 
 def main():
     """Entry point for the CLI."""
+    from leads_agent.common import install_uvloop
+
+    install_uvloop()
     app()
 
 
@@ -1,5 +1,19 @@
+from leads_agent.common.jsonio import (
+    json_dumps,
+    json_dumps_line,
+    json_loads,
+    load_json_file,
+    load_jsonl_file,
+)
+from leads_agent.common.loop import install_uvloop
 from leads_agent.common.mask import mask_secret
 
 __all__ = [
+    "install_uvloop",
+    "json_dumps",
+    "json_dumps_line",
+    "json_loads",
+    "load_json_file",
+    "load_jsonl_file",
     "mask_secret",
 ]
@@ -0,0 +1,45 @@
+"""JSON helpers that use orjson when installed (`pip install leads-agent[speedups]`)."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_dumps_line(obj: Any) -> bytes:
+    """Serialize to a single line of compact JSON bytes (JSONL), newline included."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str) + b"\n"
+    return json.dumps(obj, default=str).encode("utf-8") + b"\n"
+
+
+def load_json_file(path: str | Path) -> Any:
+    """Read and parse a JSON file in one pass over its raw bytes."""
+    return json_loads(Path(path).read_bytes())
+
+
+def load_jsonl_file(path: str | Path) -> list[Any]:
+    """Read a JSON Lines file (one JSON value per line), skipping blank lines."""
+    return [
+        json_loads(line)
+        for line in Path(path).read_bytes().splitlines()
+        if line.strip()
+    ]
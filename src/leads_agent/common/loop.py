@@ -0,0 +1,18 @@
+"""Optional uvloop event loop (`pip install leads-agent[speedups]`)."""
+
+import asyncio
+
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop for event loops created from now on, if it is installed.
+
+    pydantic-ai's `run_sync` runs each LLM call on a per-thread event loop, so
+    this speeds up every worker thread's loop. Returns True if uvloop is active.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
@@ -1,8 +1,12 @@
 from pydantic import SecretStr
 
 
-def mask_secret(secret: SecretStr | None, visible: int = 4) -> str:
-    """Mask a secret string, handling SecretStr or None."""
+def mask_secret(secret: SecretStr | None, visible: int = 4, max_mask: int = 32) -> str:
+    """
+    Mask a secret string, handling SecretStr or None.
+
+    At most `max_mask` asterisks are shown, so long tokens (e.g. JWTs) stay short.
+    """
     if secret is None:
         return "[not set]"
     # Handle pydantic SecretStr
@@ -11,6 +15,7 @@ def mask_secret(secret: SecretStr | None, visible: int = 4) -> str:
         if hasattr(secret, "get_secret_value")
         else str(secret)
     )
-    if len(val) <= visible:
+    val_len = len(val)
+    if val_len <= visible:
         return "***"
-    return val[:visible] + "*" * (len(val) - visible)
+    return val[:visible] + "*" * min(val_len - visible, max_mask)
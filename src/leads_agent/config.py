@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 
 import typer
@@ -71,6 +72,35 @@ class Settings(BaseSettings):
     dry_run: bool = Field(default=True, validation_alias="DRY_RUN")
     debug: bool = Field(default=False, validation_alias="DEBUG")
 
+    # Caching (0 disables the response cache; a path persists it across restarts)
+    response_cache_size: int = Field(
+        default=4096, validation_alias="RESPONSE_CACHE_SIZE"
+    )
+    response_cache_path: Path | None = Field(
+        default=None, validation_alias="RESPONSE_CACHE_PATH"
+    )
+
+    # Use JSON-schema response_format (constrained decoding) instead of tool calls
+    llm_native_output: bool = Field(default=False, validation_alias="LLM_NATIVE_OUTPUT")
+
+    # Ask llama.cpp-style servers to keep each stage's prompt prefix cached
+    llm_cache_prompt: bool = Field(default=False, validation_alias="LLM_CACHE_PROMPT")
+
+    # Send a tiny request at startup so on-demand backends load the model early
+    llm_warmup: bool = Field(default=True, validation_alias="LLM_WARMUP")
+
+    # Background workers running lead processing (LLM + Slack post) off Bolt's dispatch path
+    worker_concurrency: int = Field(default=8, validation_alias="WORKER_CONCURRENCY")
+
+    # Opt-in triage micro-batching for concurrent leads (batch size 1 disables)
+    triage_batch_size: int = Field(default=1, validation_alias="TRIAGE_BATCH_SIZE")
+    triage_batch_window_ms: int = Field(
+        default=250, validation_alias="TRIAGE_BATCH_WINDOW_MS"
+    )
+
+    # Ignore obvious spam/vendor pitches by keyword, without calling the LLM
+    enable_prefilter: bool = Field(default=False, validation_alias="ENABLE_PREFILTER")
+
     # Note: Prompt configuration is handled separately via PROMPT_CONFIG_PATH env var
     # or auto-discovered prompt_config.json file. See leads_agent.prompts module.
 
@@ -95,11 +125,22 @@ class Settings(BaseSettings):
         return self
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get settings instance (convenience for CLI)."""
+    """
+    Get the process-wide settings instance (convenience for CLI).
+
+    `.env` is read and validated once; callers that need different values should
+    override them on a `model_copy()` rather than mutating the shared instance.
+    """
     return Settings()
 
 
+def reset_settings() -> None:
+    """Reset the cached settings (useful for testing)."""
+    get_settings.cache_clear()
+
+
 def _find_prompt_config_source() -> str | None:
     """Find where prompt configuration is being loaded from."""
     import os
@@ -146,6 +187,17 @@ def display_config():
     table.add_row("LLM_MODEL_NAME", settings.llm_model_name)
     table.add_row("DRY_RUN", str(settings.dry_run))
     table.add_row("DEBUG", str(settings.debug))
+    table.add_row("RESPONSE_CACHE_SIZE", str(settings.response_cache_size))
+    table.add_row(
+        "RESPONSE_CACHE_PATH", str(settings.response_cache_path or "[memory only]")
+    )
+    table.add_row("LLM_NATIVE_OUTPUT", str(settings.llm_native_output))
+    table.add_row("LLM_CACHE_PROMPT", str(settings.llm_cache_prompt))
+    table.add_row("LLM_WARMUP", str(settings.llm_warmup))
+    table.add_row("WORKER_CONCURRENCY", str(settings.worker_concurrency))
+    table.add_row("TRIAGE_BATCH_SIZE", str(settings.triage_batch_size))
+    table.add_row("TRIAGE_BATCH_WINDOW_MS", str(settings.triage_batch_window_ms))
+    table.add_row("ENABLE_PREFILTER", str(settings.enable_prefilter))
 
     # Show prompt config path
     prompt_config_source = _find_prompt_config_source()
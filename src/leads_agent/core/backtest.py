@@ -1,20 +1,38 @@
-import json
-from collections.abc import Iterable
+import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 
 from leads_agent.agent import ClassificationResult, classify_lead
+from leads_agent.common import load_json_file, load_jsonl_file
 from leads_agent.config import Settings, get_settings
-from leads_agent.models import EnrichedLeadClassification, HubSpotLead
+from leads_agent.core.processor import classify_leads_batch
+from leads_agent.models import (
+    EnrichedLeadClassification,
+    HubSpotLead,
+    LeadClassification,
+)
+from leads_agent.slack import is_hubspot_lead_event
+
+# label value -> (emoji, display name)
+_LABEL_DISPLAY = {"ignore": ("🚫", "IGNORE"), "promising": ("✅", "PROMISING")}
 
 
 def load_events_from_file(file_path: str | Path) -> list[dict]:
-    """Load raw events from a JSON file created by `collect`."""
+    """
+    Load raw events from a file created by `collect`.
+
+    Accepts JSON Lines (`.jsonl`, one event per line) or a JSON array.
+    """
     path = Path(file_path)
     if not path.exists():
         raise FileNotFoundError(f"Events file not found: {path}")
 
-    with open(path) as f:
-        data = json.load(f)
+    if path.suffix == ".jsonl":
+        return load_jsonl_file(path)
+
+    data = load_json_file(path)
 
     if not isinstance(data, list):
         raise ValueError(f"Expected JSON array, got {type(data).__name__}")
@@ -44,13 +62,8 @@ def extract_leads_from_events(events: list[dict]) -> Iterable[tuple[dict, HubSpo
         if event.get("type") != "message":
             continue
 
-        # Only process HubSpot bot messages
-        if event.get("subtype") != "bot_message":
-            continue
-        if event.get("username", "").lower() != "hubspot":
-            continue
-        # Skip thread replies
-        if event.get("thread_ts") and event.get("thread_ts") != event.get("ts"):
+        # Only process top-level HubSpot lead messages
+        if not is_hubspot_lead_event(event):
             continue
 
         # Parse the lead
@@ -59,6 +72,110 @@ def extract_leads_from_events(events: list[dict]) -> Iterable[tuple[dict, HubSpo
             yield event, lead
 
 
+def _format_result(
+    index: int,
+    lead: HubSpotLead,
+    result: LeadClassification | EnrichedLeadClassification | ClassificationResult,
+    debug: bool,
+    verbose: bool,
+) -> str:
+    """Render the classification result for a single lead as one block of text."""
+    lines: list[str] = []
+    lines.append("=" * 60)
+    lines.append(f"[{index}] Processing lead...")
+
+    if debug:
+        lines.append(f"    Input: {lead.first_name} {lead.last_name} <{lead.email}>")
+        if lead.company:
+            lines.append(f"    Company: {lead.company}")
+
+    # Handle ClassificationResult wrapper when debug=True
+    if isinstance(result, ClassificationResult):
+        classification = result.classification
+        label_value = result.label
+        confidence = result.confidence
+        reason = result.reason
+
+        if debug:
+            lines.append(f"\n    Token usage: {result.usage}")
+            lines.append(f"    Messages exchanged: {len(result.message_history)}")
+            if verbose:
+                lines.append("\n    --- Message History ---")
+                lines.append(result.format_history(verbose=True))
+            else:
+                # Show condensed history - just tool calls
+                for msg in result.message_history:
+                    if hasattr(msg, "parts"):
+                        for part in msg.parts:
+                            if hasattr(part, "tool_name"):
+                                args_str = str(getattr(part, "args", {}))
+                                if len(args_str) > 80:
+                                    args_str = args_str[:80] + "..."
+                                lines.append(f"    🔧 {part.tool_name}: {args_str}")
+    else:
+        classification = result
+        label_value = result.label.value
+        confidence = result.confidence
+        reason = result.reason
+
+    label_emoji, label_display = _LABEL_DISPLAY.get(label_value) or (
+        "❓",
+        label_value.upper() if isinstance(label_value, str) else label_value,
+    )
+
+    lines.append("")
+    lines.append(f"Name: {lead.first_name} {lead.last_name}")
+    lines.append(f"Email: {lead.email}")
+    if lead.company:
+        lines.append(f"Company: {lead.company}")
+    if lead.message:
+        msg_preview = (
+            lead.message[:200] + "..." if len(lead.message) > 200 else lead.message
+        )
+        lines.append(f"Message: {msg_preview}")
+    lines.append("")
+    lines.append(f"{label_emoji} {label_display} ({confidence:.0%})")
+    lines.append(f"Reason: {reason}")
+    if hasattr(classification, "score"):
+        try:
+            lines.append(
+                f"Score: {classification.score}/5 ({classification.action.value})"
+            )
+            lines.append(f"Score Reason: {classification.score_reason}")
+        except Exception:
+            pass
+    if getattr(classification, "lead_summary", None):
+        lines.append(f"Summary: {classification.lead_summary}")
+    if getattr(classification, "key_signals", None):
+        lines.append(f"Signals: {', '.join(classification.key_signals)}")
+    if classification.company:
+        lines.append(f"Extracted Company: {classification.company}")
+
+    # Show enrichment results if available
+    if isinstance(classification, EnrichedLeadClassification):
+        if classification.company_research:
+            lines.append("\n📊 Company Research:")
+            cr = classification.company_research
+            lines.append(f"   {cr.company_name}: {cr.company_description}")
+            if cr.industry:
+                lines.append(f"   Industry: {cr.industry}")
+            if cr.website:
+                lines.append(f"   Website: {cr.website}")
+
+        if classification.contact_research:
+            lines.append("\n👤 Contact Research:")
+            cr = classification.contact_research
+            if cr.title:
+                lines.append(f"   {cr.full_name} - {cr.title}")
+            if cr.linkedin_summary:
+                lines.append(f"   {cr.linkedin_summary[:200]}...")
+
+        if classification.research_summary:
+            lines.append(f"\n📝 Summary: {classification.research_summary}")
+
+    return "\n".join(lines) + "\n"
+
+
 def run_backtest(
     events_file: str | Path,
     settings: Settings | None = None,
@@ -66,6 +183,7 @@ def run_backtest(
     max_searches: int = 4,
     debug: bool = False,
     verbose: bool = False,
+    concurrency: int = 4,
 ) -> None:
     """
     Run classification on leads from a collected events file.
@@ -77,6 +195,7 @@ def run_backtest(
         max_searches: Max web searches per lead
         debug: Show debug output
         verbose: Show full message history (with debug)
+        concurrency: Max number of leads classified in parallel
     """
     if settings is None:
         settings = get_settings()
@@ -92,105 +211,32 @@ def run_backtest(
     limit_str = f" (limit: {limit})" if limit else ""
     print(f"Backtesting HubSpot leads{mode_str}{limit_str}\n")
 
-    count = 0
-    for event, lead in extract_leads_from_events(events):
-        if limit and count >= limit:
-            break
-
-        count += 1
-        print("=" * 60)
-        print(f"[{count}] Processing lead...")
-
-        if debug:
-            print(f"    Input: {lead.first_name} {lead.last_name} <{lead.email}>")
-            if lead.company:
-                print(f"    Company: {lead.company}")
-
-        result = classify_lead(settings, lead, max_searches=max_searches, debug=debug)
-
-        # Handle ClassificationResult wrapper when debug=True
-        if isinstance(result, ClassificationResult):
-            classification = result.classification
-            label_value = result.label
-            confidence = result.confidence
-            reason = result.reason
-
-            if debug:
-                print(f"\n    Token usage: {result.usage}")
-                print(f"    Messages exchanged: {len(result.message_history)}")
-                if verbose:
-                    print("\n    --- Message History ---")
-                    print(result.format_history(verbose=True))
-                else:
-                    # Show condensed history - just tool calls
-                    for msg in result.message_history:
-                        if hasattr(msg, "parts"):
-                            for part in msg.parts:
-                                if hasattr(part, "tool_name"):
-                                    args_str = str(getattr(part, "args", {}))
-                                    if len(args_str) > 80:
-                                        args_str = args_str[:80] + "..."
-                                    print(f"    🔧 {part.tool_name}: {args_str}")
-        else:
-            classification = result
-            label_value = result.label.value
-            confidence = result.confidence
-            reason = result.reason
+    leads = [
+        lead for _, lead in islice(extract_leads_from_events(events), limit or None)
+    ]
 
-        label_emoji = {"ignore": "🚫", "promising": "✅"}.get(label_value, "❓")
+    def classify(lead: HubSpotLead):
+        return classify_lead(settings, lead, max_searches=max_searches, debug=True)
 
-        print()
-        print(f"Name: {lead.first_name} {lead.last_name}")
-        print(f"Email: {lead.email}")
-        if lead.company:
-            print(f"Company: {lead.company}")
-        if lead.message:
-            msg_preview = (
-                lead.message[:200] + "..." if len(lead.message) > 200 else lead.message
+    def classify_all() -> Iterator[
+        LeadClassification | EnrichedLeadClassification | ClassificationResult
+    ]:
+        if not debug:
+            # Triage is batched across in-flight leads; results come back in order
+            yield from classify_leads_batch(
+                settings, leads, max_searches=max_searches, concurrency=concurrency
             )
-            print(f"Message: {msg_preview}")
-        print()
-        label_display = (
-            label_value.upper() if isinstance(label_value, str) else label_value
-        )
-        print(f"{label_emoji} {label_display} ({confidence:.0%})")
-        print(f"Reason: {reason}")
-        if hasattr(classification, "score"):
-            try:
-                print(
-                    f"Score: {classification.score}/5 ({classification.action.value})"
-                )
-                print(f"Score Reason: {classification.score_reason}")
-            except Exception:
-                pass
-        if getattr(classification, "lead_summary", None):
-            print(f"Summary: {classification.lead_summary}")
-        if getattr(classification, "key_signals", None):
-            print(f"Signals: {', '.join(classification.key_signals)}")
-        if classification.company:
-            print(f"Extracted Company: {classification.company}")
-
-        # Show enrichment results if available
-        if isinstance(classification, EnrichedLeadClassification):
-            if classification.company_research:
-                print("\n📊 Company Research:")
-                cr = classification.company_research
-                print(f"   {cr.company_name}: {cr.company_description}")
-                if cr.industry:
-                    print(f"   Industry: {cr.industry}")
-                if cr.website:
-                    print(f"   Website: {cr.website}")
-
-            if classification.contact_research:
-                print("\n👤 Contact Research:")
-                cr = classification.contact_research
-                if cr.title:
-                    print(f"   {cr.full_name} - {cr.title}")
-                if cr.linkedin_summary:
-                    print(f"   {cr.linkedin_summary[:200]}...")
-
-            if classification.research_summary:
-                print(f"\n📝 Summary: {classification.research_summary}")
+            return
+        # Debug output needs each lead's own message history, so skip triage batching.
+        # Classification is network-bound, so still run leads in parallel.
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            yield from executor.map(classify, leads)
+
+    count = 0
+    for lead, result in zip(leads, classify_all()):
+        count += 1
+        # One write per lead instead of a dozen line-buffered prints
+        sys.stdout.write(_format_result(count, lead, result, debug, verbose))
 
     print("=" * 60)
     if count == 0:
@@ -10,6 +10,8 @@ from leads_agent.config import get_settings
 
 console = Console()
 
+_DECISION_COLORS = {"ignore": "red", "promising": "green"}
+
 
 def classify(message: str, debug: bool, max_searches: int, verbose: bool):
     settings = get_settings()
@@ -36,7 +38,7 @@ def classify(message: str, debug: bool, max_searches: int, verbose: bool):
     table.add_column("Field", style="cyan")
     table.add_column("Value")
 
-    decision_color = {"ignore": "red", "promising": "green"}.get(label_value, "white")
+    decision_color = _DECISION_COLORS.get(label_value, "white")
     table.add_row("Decision", f"[bold {decision_color}]{label_value}[/]")
     table.add_row("Confidence", f"{confidence:.0%}")
     table.add_row("Reason", reason)
@@ -1,16 +1,18 @@
-from slack_sdk.errors import SlackApiError
 from rich import print as rprint
 import typer
 from rich.panel import Panel
 import json
 
+from itertools import islice
 from pathlib import Path
 
-from leads_agent.slack import slack_client
+from leads_agent.slack import iter_channel_history, slack_client
 from leads_agent.config import get_settings
 
 
 def pull_history(channel_id: str | None, limit: int, output: Path, print_only: bool):
+    from slack_sdk.errors import SlackApiError
+
     settings = get_settings()
     try:
         settings.require_slack_client()
@@ -31,7 +33,14 @@ def pull_history(channel_id: str | None, limit: int, output: Path, print_only: b
     rprint(f"[dim]Channel: {target_channel} | Limit: {limit}[/]\n")
 
     try:
-        resp = client.conversations_history(channel=target_channel, limit=limit)
+        messages = list(
+            islice(
+                iter_channel_history(
+                    client, target_channel, page_size=max(1, min(limit, 200))
+                ),
+                limit,
+            )
+        )
     except SlackApiError as e:
         error_code = e.response.get("error", "unknown")
         rprint(f"[red]Slack API error:[/] {error_code}")
@@ -48,8 +57,6 @@ def pull_history(channel_id: str | None, limit: int, output: Path, print_only: b
 
         raise typer.Exit(1)
 
-    messages = resp.get("messages", [])
-
     if print_only:
         for msg in messages:
             rprint("=" * 60)
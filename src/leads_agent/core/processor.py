@@ -1,13 +1,18 @@
+import asyncio
 import hashlib
 import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import singledispatch
 from typing import TYPE_CHECKING
 
 import logfire
 from opentelemetry import trace
 
-from leads_agent.agent import classify_lead
+from leads_agent.agent import classify_lead, classify_lead_async
+from leads_agent.batcher import create_triage_batcher
 from leads_agent.models import (
     EnrichedLeadClassification,
     HubSpotLead,
@@ -16,6 +21,7 @@ from leads_agent.models import (
 from leads_agent.slack import slack_client
 
 if TYPE_CHECKING:
+    from leads_agent.batcher import TriageBatcher
     from leads_agent.config import Settings
 
 # Configure logfire only if token is available
@@ -38,6 +44,10 @@ def _logfire_span(name: str, **kwargs):
         yield
 
 
+# Go / No-go header per label (taxonomy stays hidden from Slack)
+_DECISION_HEADERS = {"promising": "✅ *GO*", "ignore": "🚫 *IGNORE*"}
+
+
 @dataclass
 class ProcessedLead:
     """Result of processing a lead."""
@@ -45,10 +55,11 @@ class ProcessedLead:
     lead: HubSpotLead
     classification: LeadClassification | EnrichedLeadClassification
     slack_message: str
+    label: str = field(init=False)
 
-    @property
-    def label(self) -> str:
-        return self.classification.label.value
+    def __post_init__(self) -> None:
+        # Classifications are frozen, so the label can be resolved once
+        self.label = self.classification.label.value
 
     @property
     def is_promising(self) -> bool:
@@ -85,24 +96,22 @@ def format_slack_message(
             parts.append(f"*Message:* {msg_preview}")
         parts.append("")  # blank line
 
+    _append_classification(classification, lead, parts)
+    return "\n".join(parts)
+
+
+def _append_decision(classification: LeadClassification, parts: list[str]) -> None:
     # Go / No-go (hide taxonomy)
-    if classification.label.value == "promising":
-        parts.append(f"✅ *GO* ({classification.confidence:.0%})")
-    else:
-        parts.append(f"🚫 *IGNORE* ({classification.confidence:.0%})")
+    header = _DECISION_HEADERS.get(
+        classification.label.value, _DECISION_HEADERS["ignore"]
+    )
+    parts.append(f"{header} ({classification.confidence:.0%})")
     parts.append(f"_{classification.reason}_")
 
-    # Optional final score (for promising leads after research+scoring)
-    if (
-        getattr(classification, "score", None) is not None
-        and getattr(classification, "action", None) is not None
-    ):
-        parts.append(
-            f"\n⭐ *Score:* {classification.score}/5 · *Action:* {classification.action.value}"
-        )
-        if getattr(classification, "score_reason", None):
-            parts.append(f"_{classification.score_reason}_")
 
+def _append_summary(
+    classification: LeadClassification, lead: HubSpotLead, parts: list[str]
+) -> None:
     # Optional lead summary/signals (useful when triage output includes them)
     if classification.lead_summary:
         parts.append(f"\n*🧾 Summary:* {classification.lead_summary}")
@@ -113,46 +122,67 @@ def format_slack_message(
     if classification.company and classification.company != lead.company:
         parts.append(f"\n📋 Company: {classification.company}")
 
-    # Enrichment results
-    if isinstance(classification, EnrichedLeadClassification):
-        if classification.company_research:
-            cr = classification.company_research
-            parts.append("\n*📊 Company Research:*")
-            parts.append(f"• *{cr.company_name}*: {cr.company_description}")
-            if cr.industry:
-                parts.append(f"• Industry: {cr.industry}")
-            if cr.company_size:
-                parts.append(f"• Size: {cr.company_size}")
-            if cr.website:
-                # Format URL for Slack clickability
-                url = (
-                    cr.website
-                    if cr.website.startswith("http")
-                    else f"https://{cr.website}"
-                )
-                parts.append(f"• Website: <{url}|{cr.website}>")
-            if cr.relevance_notes:
-                parts.append(f"• Relevance: {cr.relevance_notes}")
-
-        if classification.contact_research:
-            cr = classification.contact_research
-            parts.append("\n*👤 Contact Research:*")
-            title_str = f" - {cr.title}" if cr.title else ""
-            parts.append(f"• *{cr.full_name}*{title_str}")
-            if cr.linkedin_summary:
-                summary = (
-                    cr.linkedin_summary[:300] + "..."
-                    if len(cr.linkedin_summary) > 300
-                    else cr.linkedin_summary
-                )
-                parts.append(f"• {summary}")
-            if cr.relevance_notes:
-                parts.append(f"• Relevance: {cr.relevance_notes}")
 
-        if classification.research_summary:
-            parts.append(f"\n*📝 Summary:*\n{classification.research_summary}")
+@singledispatch
+def _append_classification(
+    classification: LeadClassification, lead: HubSpotLead, parts: list[str]
+) -> None:
+    """Triage-only results: decision and summary, no score or research."""
+    _append_decision(classification, parts)
+    _append_summary(classification, lead, parts)
 
-    return "\n".join(parts)
+
+@_append_classification.register(EnrichedLeadClassification)
+def _append_enriched_classification(
+    classification: EnrichedLeadClassification, lead: HubSpotLead, parts: list[str]
+) -> None:
+    _append_decision(classification, parts)
+
+    # Optional final score (for promising leads after research+scoring)
+    if classification.score is not None and classification.action is not None:
+        parts.append(
+            f"\n⭐ *Score:* {classification.score}/5 · *Action:* {classification.action.value}"
+        )
+        if classification.score_reason:
+            parts.append(f"_{classification.score_reason}_")
+
+    _append_summary(classification, lead, parts)
+
+    # Enrichment results
+    if classification.company_research:
+        cr = classification.company_research
+        parts.append("\n*📊 Company Research:*")
+        parts.append(f"• *{cr.company_name}*: {cr.company_description}")
+        if cr.industry:
+            parts.append(f"• Industry: {cr.industry}")
+        if cr.company_size:
+            parts.append(f"• Size: {cr.company_size}")
+        if cr.website:
+            # Format URL for Slack clickability
+            url = (
+                cr.website if cr.website.startswith("http") else f"https://{cr.website}"
+            )
+            parts.append(f"• Website: <{url}|{cr.website}>")
+        if cr.relevance_notes:
+            parts.append(f"• Relevance: {cr.relevance_notes}")
+
+    if classification.contact_research:
+        cr = classification.contact_research
+        parts.append("\n*👤 Contact Research:*")
+        title_str = f" - {cr.title}" if cr.title else ""
+        parts.append(f"• *{cr.full_name}*{title_str}")
+        if cr.linkedin_summary:
+            summary = (
+                cr.linkedin_summary[:300] + "..."
+                if len(cr.linkedin_summary) > 300
+                else cr.linkedin_summary
+            )
+            parts.append(f"• {summary}")
+        if cr.relevance_notes:
+            parts.append(f"• Relevance: {cr.relevance_notes}")
+
+    if classification.research_summary:
+        parts.append(f"\n*📝 Summary:*\n{classification.research_summary}")
 
 
 def process_lead(
@@ -160,6 +190,7 @@ def process_lead(
     lead: HubSpotLead,
     *,
     max_searches: int = 4,
+    triage_batcher: "TriageBatcher | None" = None,
 ) -> ProcessedLead:
     """
     Process a single lead: classify and format response.
@@ -168,11 +199,14 @@ def process_lead(
         settings: Application settings
         lead: Parsed HubSpot lead
         max_searches: Max web searches for enrichment
+        triage_batcher: Optional batcher to coalesce triage with concurrent leads
 
     Returns:
         ProcessedLead with classification and formatted Slack message
     """
-    classification = classify_lead(settings, lead, max_searches=max_searches)
+    classification = classify_lead(
+        settings, lead, max_searches=max_searches, triage_batcher=triage_batcher
+    )
 
     # Handle ClassificationResult wrapper (from debug mode)
     if hasattr(classification, "classification"):
@@ -187,6 +221,72 @@ def process_lead(
     )
 
 
+def classify_leads_batch(
+    settings: "Settings",
+    leads: Iterable[HubSpotLead],
+    *,
+    max_searches: int = 4,
+    concurrency: int = 4,
+) -> Iterator[LeadClassification | EnrichedLeadClassification]:
+    """
+    Classify many leads at once, without formatting Slack messages (backtest).
+
+    Triage for leads in flight together is batched into shared LLM requests;
+    research and scoring of promising leads run concurrently per lead.
+
+    Args:
+        settings: Application settings
+        leads: Parsed HubSpot leads
+        max_searches: Max web searches for enrichment
+        concurrency: Max leads in flight (also bounds the triage batch size)
+
+    Yields:
+        The classification for each lead, in input order
+    """
+    triage_batcher = create_triage_batcher(settings)
+
+    def classify(lead: HubSpotLead) -> LeadClassification | EnrichedLeadClassification:
+        return classify_lead(
+            settings, lead, max_searches=max_searches, triage_batcher=triage_batcher
+        )
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            yield from executor.map(classify, leads)
+    finally:
+        if triage_batcher is not None:
+            triage_batcher.close()
+
+
+def process_leads_batch(
+    settings: "Settings",
+    leads: Iterable[HubSpotLead],
+    *,
+    max_searches: int = 4,
+    concurrency: int = 4,
+) -> Iterator[ProcessedLead]:
+    """
+    Process many leads at once: `classify_leads_batch` plus Slack formatting.
+
+    Yields:
+        ProcessedLead for each lead, in input order
+    """
+    leads = list(leads)
+    for lead, classification in zip(
+        leads,
+        classify_leads_batch(
+            settings, leads, max_searches=max_searches, concurrency=concurrency
+        ),
+    ):
+        yield ProcessedLead(
+            lead=lead,
+            classification=classification,
+            slack_message=format_slack_message(
+                lead, classification, include_lead_info=False
+            ),
+        )
+
+
 def post_to_slack(
     settings: "Settings",
     processed: ProcessedLead,
@@ -243,6 +343,7 @@ def process_and_post(
     thread_ts: str | None = None,
     max_searches: int = 4,
     include_lead_info: bool = False,
+    triage_batcher: "TriageBatcher | None" = None,
 ) -> ProcessedLead:
     """
     Process a lead and post the result to Slack.
@@ -256,6 +357,7 @@ def process_and_post(
         thread_ts: If provided, post as thread reply (production mode)
         max_searches: Max web searches for enrichment
         include_lead_info: Include lead details in message (test mode)
+        triage_batcher: Optional batcher to coalesce triage with concurrent leads
 
     Returns:
         ProcessedLead with results
@@ -297,7 +399,9 @@ def process_and_post(
         include_lead_info=include_lead_info,
         dry_run=settings.dry_run,
     ):
-        processed = process_lead(settings, lead, max_searches=max_searches)
+        processed = process_lead(
+            settings, lead, max_searches=max_searches, triage_batcher=triage_batcher
+        )
 
         post_to_slack(
             settings,
@@ -308,3 +412,71 @@ def process_and_post(
         )
 
         return processed
+
+
+async def process_and_post_many(
+    settings: "Settings",
+    leads: Iterable[tuple[HubSpotLead, str | None]],
+    *,
+    channel_id: str,
+    max_searches: int = 4,
+    include_lead_info: bool = False,
+    concurrency: int = 4,
+    triage_batcher: "TriageBatcher | None" = None,
+) -> list[ProcessedLead | BaseException]:
+    """
+    Process and post many leads concurrently on one event loop.
+
+    LLM calls run natively async; Slack posts (sync WebClient) run in worker
+    threads, so they overlap with other leads' classification.
+
+    Args:
+        settings: Application settings
+        leads: (lead, thread_ts) pairs; a None thread_ts posts to the channel
+        channel_id: Where to post the results
+        max_searches: Max web searches for enrichment
+        include_lead_info: Include lead details in message (test mode)
+        concurrency: Max leads in flight
+        triage_batcher: Optional batcher to coalesce triage across the leads
+
+    Returns:
+        ProcessedLead, or the exception raised while handling it, for each lead
+        in input order
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(lead: HubSpotLead, thread_ts: str | None) -> ProcessedLead:
+        async with semaphore:
+            with _logfire_span(
+                "lead.process",
+                slack_channel_id=channel_id,
+                slack_thread_ts=thread_ts,
+                email=lead.email,
+                company=lead.company,
+                max_searches=max_searches,
+                dry_run=settings.dry_run,
+            ):
+                classification = await classify_lead_async(
+                    settings,
+                    lead,
+                    max_searches=max_searches,
+                    triage_batcher=triage_batcher,
+                )
+                processed = ProcessedLead(
+                    lead=lead,
+                    classification=classification,
+                    slack_message=format_slack_message(lead, classification),
+                )
+                await asyncio.to_thread(
+                    post_to_slack,
+                    settings,
+                    processed,
+                    channel_id=channel_id,
+                    thread_ts=thread_ts,
+                    include_lead_info=include_lead_info,
+                )
+                return processed
+
+    return await asyncio.gather(
+        *(run(lead, thread_ts) for lead, thread_ts in leads), return_exceptions=True
+    )
@@ -1,15 +1,25 @@
-from slack_sdk.errors import SlackApiError
+import asyncio
+
 from rich import print as rprint
 import typer
 from rich.panel import Panel
 
+from leads_agent.batcher import create_triage_batcher
 from leads_agent.models import HubSpotLead
-from leads_agent.core.processor import process_and_post
-from leads_agent.slack import slack_client
+from leads_agent.core.processor import process_and_post_many
+from leads_agent.slack import iter_hubspot_lead_pages, slack_client
 from leads_agent.config import get_settings
 
 
-def replay(channel_id: str, limit: int, dry_run: bool, max_searches: int):
+def replay(
+    channel_id: str,
+    limit: int,
+    dry_run: bool,
+    max_searches: int,
+    concurrency: int = 4,
+):
+    from slack_sdk.errors import SlackApiError
+
     settings = get_settings()
     try:
         settings.require_slack_client()
@@ -19,7 +29,7 @@ def replay(channel_id: str, limit: int, dry_run: bool, max_searches: int):
 
     # Override dry_run if explicitly set
     if dry_run is not None:
-        settings.dry_run = dry_run
+        settings = settings.model_copy(update={"dry_run": dry_run})
 
     target_channel = channel_id or settings.slack_channel_id
     if not target_channel:
@@ -39,76 +49,68 @@ def replay(channel_id: str, limit: int, dry_run: bool, max_searches: int):
         f"[dim]Channel: {target_channel} | Leads to replay: {limit} | Dry run: {settings.dry_run}[/]\n"
     )
 
-    # Paginate until we replay `limit` HubSpot lead messages (or history is exhausted).
+    # Scan history until we find `limit` HubSpot lead messages (or history is exhausted),
+    # replaying them in bounded chunks as they are found.
+    chunk_size = max(1, concurrency, settings.triage_batch_size)
+    pending: list[tuple[dict, HubSpotLead]] = []
+    found = 0
     processed = 0
-    cursor: str | None = None
     scanned = 0
 
-    try:
-        while processed < limit:
-            history_kwargs: dict = {"channel": target_channel, "limit": 200}
-            if cursor:
-                history_kwargs["cursor"] = cursor
-
-            resp = client.conversations_history(**history_kwargs)
-
-            messages = resp.get("messages", [])
-            scanned += len(messages)
-
-            if not messages:
-                break
-
-            for msg in messages:
-                # conversations_history messages don't include channel; add for parity with event payloads
-                event = dict(msg)
-                event["channel"] = target_channel
-
-                # Quick filter (match production behavior)
-                if event.get("subtype") != "bot_message":
-                    continue
-                if event.get("username", "").lower() != "hubspot":
-                    continue
-                if event.get("thread_ts") and event.get("thread_ts") != event.get("ts"):
-                    continue
-                if not event.get("attachments"):
-                    continue
-
-                lead = HubSpotLead.from_slack_event(event)
-                if not lead:
-                    continue
-
-                processed += 1
-
-                result = process_and_post(
-                    settings,
-                    lead,
-                    channel_id=target_channel,
-                    thread_ts=event.get(
-                        "ts"
-                    ),  # replay as thread reply, like production
-                    max_searches=max_searches,
-                )
-
-                if settings.dry_run:
-                    rprint(
-                        Panel(
-                            result.slack_message,
-                            title=f"Replay {processed}/{limit}",
-                            border_style="yellow",
-                        )
-                    )
-                else:
-                    ts = event.get("ts", "?")
-                    rprint(
-                        f"[green]✓[/] Posted replay {processed}/{limit} (thread_ts={ts})"
+    def replay_chunk(runner: asyncio.Runner) -> None:
+        """Process and post the pending leads, reporting results in history order."""
+        nonlocal processed
+        # Classification and posting are network-bound, so process the chunk's
+        # leads concurrently (replayed as thread replies, like production)
+        results = runner.run(
+            process_and_post_many(
+                settings,
+                [(lead, event.get("ts")) for event, lead in pending],
+                channel_id=target_channel,
+                max_searches=max_searches,
+                concurrency=concurrency,
+                triage_batcher=triage_batcher,
+            )
+        )
+        first = found - len(pending) + 1
+        for index, ((event, _), result) in enumerate(zip(pending, results), first):
+            ts = event.get("ts", "?")
+            if isinstance(result, SlackApiError):
+                raise result
+            if isinstance(result, BaseException):
+                rprint(f"[red]✗[/] Replay {index}/{limit} failed (ts={ts}): {result}")
+                continue
+            processed += 1
+            if settings.dry_run:
+                rprint(
+                    Panel(
+                        result.slack_message,
+                        title=f"Replay {index}/{limit}",
+                        border_style="yellow",
                     )
+                )
+            else:
+                rprint(f"[green]✓[/] Posted replay {index}/{limit} (thread_ts={ts})")
+        pending.clear()
 
-                if processed >= limit:
+    # Leads replayed together share batched triage requests
+    triage_batcher = create_triage_batcher(settings)
+    try:
+        # One event loop for every chunk, so pooled LLM connections are reused
+        with asyncio.Runner() as runner:
+            for page_scanned, page_leads in iter_hubspot_lead_pages(
+                client, target_channel
+            ):
+                scanned += page_scanned
+                for item in page_leads[: limit - found]:
+                    pending.append(item)
+                    found += 1
+                    if len(pending) >= chunk_size:
+                        replay_chunk(runner)
+                if found >= limit:
                     break
-
-            cursor = (resp.get("response_metadata") or {}).get("next_cursor") or None
-            if not cursor:
-                break
+            if pending:
+                replay_chunk(runner)
 
     except SlackApiError as e:
         error_code = e.response.get("error", "unknown")
@@ -123,6 +125,9 @@ def replay(channel_id: str, limit: int, dry_run: bool, max_searches: int):
         if error_code in hints:
             rprint(f"[yellow]Hint:[/] {hints[error_code]}")
         raise typer.Exit(1)
+    finally:
+        if triage_batcher is not None:
+            triage_batcher.close()
 
     if processed == 0:
         rprint("[yellow]No HubSpot lead messages found in the scanned history.[/]")
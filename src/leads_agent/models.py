@@ -2,9 +2,14 @@ from __future__ import annotations
 
 import re
 from enum import Enum
-from typing import Any
+from typing import Any, Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+# Leads and classifications are never mutated after construction, so they are
+# frozen and shared by reference when nested instead of being re-validated
+_IMMUTABLE = ConfigDict(frozen=True, revalidate_instances="never")
 
 
 class LeadLabel(str, Enum):
@@ -20,9 +25,27 @@ class LeadAction(str, Enum):
     prioritize = "prioritize"
 
 
+# Pattern: *Field Name*: Value
+# Handle both plain text and Slack markdown links like <mailto:email|email>
+_HUBSPOT_FIELD_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = tuple(
+    (field, re.compile(pattern, re.IGNORECASE | re.DOTALL))
+    for field, pattern in (
+        ("first_name", r"\*First Name\*:\s*(.+?)(?=\n\*|\n*$)"),
+        ("last_name", r"\*Last Name\*:\s*(.+?)(?=\n\*|\n*$)"),
+        ("email", r"\*Email\*:\s*(?:<mailto:[^|]+\|)?([^\s>]+)"),
+        ("company", r"\*Company\*:\s*(.+?)(?=\n\*|\n*$)"),
+        ("message", r"\*Message\*:\s*(.+)"),
+    )
+)
+_MAILTO_LINK_RE = re.compile(r"<mailto:[^|]+\|([^>]+)>")
+_SLACK_LINK_RE = re.compile(r"<[^|]+\|([^>]+)>")
+
+
 class HubSpotLead(BaseModel):
     """Parsed lead data from HubSpot Slack message."""
 
+    model_config = _IMMUTABLE
+
     first_name: str | None = None
     last_name: str | None = None
     email: str | None = None
@@ -37,21 +60,21 @@ class HubSpotLead(BaseModel):
 
         Returns None if this isn't a HubSpot message.
         """
+        get = event.get
         # Must be a bot_message from HubSpot
-        if event.get("subtype") != "bot_message":
+        if get("subtype") != "bot_message":
             return None
-        if event.get("username", "").lower() != "hubspot":
+        if (get("username") or "").lower() != "hubspot":
             return None
 
         # Get text from attachments (HubSpot puts lead data there)
-        attachments = event.get("attachments", [])
+        attachments = get("attachments")
         if not attachments:
             return None
 
         # Use fallback or text from first attachment
         attachment = attachments[0]
-        raw_text = attachment.get("fallback") or attachment.get("text") or ""
-
+        raw_text = attachment.get("fallback") or attachment.get("text")
         if not raw_text:
             return None
 
@@ -60,51 +83,50 @@ class HubSpotLead(BaseModel):
     @classmethod
     def _parse_hubspot_text(cls, text: str) -> HubSpotLead:
         """Parse HubSpot formatted text to extract lead fields."""
-        lead = cls(raw_text=text)
-
-        # Pattern: *Field Name*: Value
-        # Handle both plain text and Slack markdown links like <mailto:email|email>
-        patterns = {
-            "first_name": r"\*First Name\*:\s*(.+?)(?=\n\*|\n*$)",
-            "last_name": r"\*Last Name\*:\s*(.+?)(?=\n\*|\n*$)",
-            "email": r"\*Email\*:\s*(?:<mailto:[^|]+\|)?([^\s>]+)",
-            "company": r"\*Company\*:\s*(.+?)(?=\n\*|\n*$)",
-            "message": r"\*Message\*:\s*(.+)",
-        }
-
-        for field, pattern in patterns.items():
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        fields: dict[str, str] = {}
+        for field, pattern in _HUBSPOT_FIELD_PATTERNS:
+            match = pattern.search(text)
             if match:
                 value = match.group(1).strip()
-                # Clean up the value
-                value = re.sub(
-                    r"<mailto:[^|]+\|([^>]+)>", r"\1", value
-                )  # Clean email links
-                value = re.sub(r"<[^|]+\|([^>]+)>", r"\1", value)  # Clean other links
-                setattr(lead, field, value)
+                # Clean up Slack link markup (email links, then other links)
+                if "<" in value:
+                    value = _MAILTO_LINK_RE.sub(r"\1", value)
+                    value = _SLACK_LINK_RE.sub(r"\1", value)
+                fields[field] = value
 
-        return lead
+        return cls(raw_text=text, **fields)
 
     def to_prompt_text(self) -> str:
-        """Format lead data for LLM prompt."""
-        parts = []
-        if self.first_name:
-            parts.append(f"First Name: {self.first_name}")
-        if self.last_name:
-            parts.append(f"Last Name: {self.last_name}")
-        if self.email:
-            parts.append(f"Email: {self.email}")
-        if self.company:
-            parts.append(f"Company: {self.company}")
-        if self.message:
-            parts.append(f"Message: {self.message}")
-
-        return "\n".join(parts) if parts else self.raw_text
+        """
+        Format lead data for LLM prompt.
+
+        Every field is always emitted, in a fixed order after a fixed header, so
+        prompts for different leads share as long a prefix as possible with
+        servers' prompt caches.
+        """
+        if not (
+            self.first_name
+            or self.last_name
+            or self.email
+            or self.company
+            or self.message
+        ):
+            return self.raw_text
+        return (
+            "Lead details:\n"
+            f"First Name: {self.first_name or 'unknown'}\n"
+            f"Last Name: {self.last_name or 'unknown'}\n"
+            f"Email: {self.email or 'unknown'}\n"
+            f"Company: {self.company or 'unknown'}\n"
+            f"Message: {self.message or 'unknown'}"
+        )
 
 
 class LeadClassification(BaseModel):
     """LLM output for lead classification with extracted contact info."""
 
+    model_config = _IMMUTABLE
+
     # Contact info (extracted/confirmed by LLM)
     first_name: str | None = Field(default=None, description="Contact's first name")
     last_name: str | None = Field(default=None, description="Contact's last name")
@@ -128,10 +150,23 @@ class LeadClassification(BaseModel):
         description="Short bullet-like signals (e.g., 'student project', 'budget mentioned', 'vendor pitch').",
     )
 
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> Self:
+        """
+        Build from data that was already validated (e.g. our own cache entries).
+
+        Skips validation via `model_construct`; never use this for LLM or user input.
+        """
+        fields = dict(data)
+        fields["label"] = LeadLabel(fields["label"])
+        return cls.model_construct(**fields)
+
 
 class CompanyResearch(BaseModel):
     """Research findings about a company."""
 
+    model_config = _IMMUTABLE
+
     company_name: str = Field(description="Official company name")
     company_description: str = Field(
         description="Brief description of what the company does"
@@ -149,6 +184,8 @@ class CompanyResearch(BaseModel):
 class ContactResearch(BaseModel):
     """Research findings about a contact person."""
 
+    model_config = _IMMUTABLE
+
     full_name: str = Field(description="Contact's full name")
     title: str | None = Field(default=None, description="Job title or role")
     linkedin_summary: str | None = Field(
@@ -188,3 +225,18 @@ class EnrichedLeadClassification(LeadClassification):
         default=None,
         description="Brief explanation for the score/action decision.",
     )
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> Self:
+        fields = dict(data)
+        if fields.get("company_research") is not None:
+            fields["company_research"] = CompanyResearch.model_construct(
+                **fields["company_research"]
+            )
+        if fields.get("contact_research") is not None:
+            fields["contact_research"] = ContactResearch.model_construct(
+                **fields["contact_research"]
+            )
+        if fields.get("action") is not None:
+            fields["action"] = LeadAction(fields["action"])
+        return super().from_trusted(fields)
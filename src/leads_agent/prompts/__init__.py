@@ -1,10 +1,12 @@
-from leads_agent.prompts.utils import display_prompts
-from leads_agent.prompts.manager import (
-    ICPConfig,
-    PromptConfig,
-    PromptManager,
-    get_prompt_manager,
-)
+# Resolved on first access: the prompt models and manager don't need rich or the
+# settings stack, which only `display_prompts` uses.
+_LAZY_EXPORTS = {
+    "display_prompts": "leads_agent.prompts.utils",
+    "ICPConfig": "leads_agent.prompts.manager",
+    "PromptConfig": "leads_agent.prompts.manager",
+    "PromptManager": "leads_agent.prompts.manager",
+    "get_prompt_manager": "leads_agent.prompts.manager",
+}
 
 __all__ = [
     "display_prompts",
@@ -13,3 +15,14 @@ __all__ = [
     "PromptManager",
     "get_prompt_manager",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
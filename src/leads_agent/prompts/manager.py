@@ -1,8 +1,13 @@
 import json
+from dataclasses import dataclass, fields
+from functools import wraps
 from pathlib import Path
+from stat import S_ISREG
+from typing import Callable
 
 from pydantic import BaseModel, Field
 
+from leads_agent.common import json_loads
 from leads_agent.prompts.prompts import (
     BASE_RESEARCH_PROMPT,
     BASE_SCORING_PROMPT,
@@ -47,6 +52,11 @@ class ICPConfig(BaseModel):
         examples=[["Requesting free services", "Student projects", "Personal use"]],
     )
 
+    def is_empty(self) -> bool:
+        """Check if the profile has any values set."""
+        # Every field defaults to None, so only explicitly set fields can hold a value
+        return all(getattr(self, name) is None for name in self.__pydantic_fields_set__)
+
 
 class PromptConfig(BaseModel):
     """
@@ -102,19 +112,67 @@ class PromptConfig(BaseModel):
 
     def is_empty(self) -> bool:
         """Check if configuration has any values set."""
-        return all(
-            v is None
-            for v in [
-                self.company_name,
-                self.services_description,
-                self.icp,
-                self.qualifying_questions,
-                self.custom_instructions,
-                self.research_focus_areas,
-            ]
+        # Every field defaults to None, so only explicitly set fields can hold a value
+        return all(getattr(self, name) is None for name in self.__pydantic_fields_set__)
+
+
+# Shared empty config for the no-config paths; read-only, `model_copy()` to modify
+_EMPTY_CONFIG = PromptConfig()
+
+
+@dataclass(frozen=True, slots=True)
+class _PreparedICP:
+    """ICP list fields joined once per installed config, for the prompt builders."""
+
+    target_industries: str = ""
+    target_company_sizes: str = ""
+    target_roles: str = ""
+    geographic_focus: str = ""
+    disqualifying_signals: str = ""
+
+    @classmethod
+    def from_icp(cls, icp: ICPConfig | None) -> "_PreparedICP":
+        if icp is None:
+            return cls()
+        return cls(
+            **{f.name: ", ".join(getattr(icp, f.name) or ()) for f in fields(cls)}
         )
 
 
+# (ICP field, line template) pairs rendered into each prompt's profile section
+_LEAD_ICP_LABELS = (
+    ("description", "**Target Profile:** {}"),
+    ("target_industries", "**Target Industries:** {}"),
+    ("target_company_sizes", "**Target Company Sizes:** {}"),
+    ("target_roles", "**Decision Maker Roles:** {}"),
+    ("geographic_focus", "**Geographic Focus:** {}"),
+    ("disqualifying_signals", "**Disqualifying Signals:** {}"),
+)
+_FIT_ICP_LABELS = (
+    ("description", "**Ideal Profile:** {}"),
+    ("target_industries", "**Priority Industries:** {}"),
+    ("target_company_sizes", "**Target Company Sizes:** {}"),
+    ("target_roles", "**Decision Maker Roles:** {}"),
+    ("disqualifying_signals", "**Red Flags:** {}"),
+)
+
+
+def _cached_prompt(
+    build: Callable[["PromptManager"], str],
+) -> Callable[["PromptManager"], str]:
+    """Memoize a prompt builder until the manager's configuration changes."""
+    name = build.__name__
+
+    @wraps(build)
+    def wrapper(self: "PromptManager") -> str:
+        prompt = self._prompt_cache.get(name)
+        if prompt is None:
+            prompt = self._prompt_cache[name] = build(self)
+        return prompt
+
+    return wrapper
+
+
 class PromptManager:
     """
     Manages prompt configuration and builds dynamic prompts.
@@ -124,11 +182,28 @@ class PromptManager:
     2. Environment variable PROMPT_CONFIG_JSON
     3. Config file (prompt_config.json in project root)
     4. Defaults (empty configuration)
+
+    Prompts for the base config are built up front, since most deployments never
+    change it at runtime. Built prompts are cached until `update_config`/
+    `reset_config`, after which they are rebuilt on first use. Treat installed
+    configs as immutable; after mutating one in place, call `invalidate()`.
     """
 
+    __slots__ = (
+        "_config",
+        "_runtime_config",
+        "_prompt_cache",
+        "_icp_joined",
+        "_config_fingerprint",
+    )
+
     def __init__(self, config: PromptConfig | None = None):
-        self._config = config or PromptConfig()
+        self._config = config or _EMPTY_CONFIG
         self._runtime_config: PromptConfig | None = None
+        self._prompt_cache: dict[str, str] = {}
+        self._icp_joined = _PreparedICP.from_icp(self.config.icp)
+        self._config_fingerprint: str | None = None
+        self._prebuild()
 
     @property
     def config(self) -> PromptConfig:
@@ -140,181 +215,116 @@ class PromptManager:
     def update_config(self, config: PromptConfig) -> None:
         """Update runtime configuration."""
         self._runtime_config = config
+        self.invalidate()
 
     def reset_config(self) -> None:
         """Reset to base configuration (clear runtime overrides)."""
         self._runtime_config = None
+        self.invalidate()
 
+    def invalidate(self) -> None:
+        """Drop cached prompts so the next build reflects the current config."""
+        self._prompt_cache.clear()
+        self._icp_joined = _PreparedICP.from_icp(self.config.icp)
+        self._config_fingerprint = None
+
+    @property
+    def config_fingerprint(self) -> str:
+        """JSON form of the effective config, serialized once per installed config."""
+        if self._config_fingerprint is None:
+            self._config_fingerprint = self.config.model_dump_json()
+        return self._config_fingerprint
+
+    def _prebuild(self) -> None:
+        """Build and cache every prompt for the current config."""
+        self.build_classification_prompt()
+        self.build_triage_prompt()
+        self.build_scoring_prompt()
+        self.build_research_prompt()
+
+    @_cached_prompt
     def build_classification_prompt(self) -> str:
         """
         Build the complete classification system prompt.
 
         Combines base prompt with deployment-specific configuration.
         """
-        parts = [BASE_SYSTEM_PROMPT]
-        cfg = self.config
-
-        # Add company context
-        if cfg.company_name or cfg.services_description:
-            context_parts = []
-            if cfg.company_name:
-                context_parts.append(f"Company: {cfg.company_name}")
-            if cfg.services_description:
-                context_parts.append(f"Services: {cfg.services_description}")
-            parts.append(
-                "\n--- Internal Company Context ---\n" + "\n".join(context_parts)
-            )
-
-        # Add ICP criteria
-        if cfg.icp and not cfg.icp.model_dump(exclude_none=True) == {}:
-            icp = cfg.icp
-            icp_parts = []
-
-            if icp.description:
-                icp_parts.append(f"**Target Profile:** {icp.description}")
-
-            if icp.target_industries:
-                icp_parts.append(
-                    f"**Target Industries:** {', '.join(icp.target_industries)}"
-                )
-
-            if icp.target_company_sizes:
-                icp_parts.append(
-                    f"**Target Company Sizes:** {', '.join(icp.target_company_sizes)}"
-                )
-
-            if icp.target_roles:
-                icp_parts.append(
-                    f"**Decision Maker Roles:** {', '.join(icp.target_roles)}"
-                )
-
-            if icp.geographic_focus:
-                icp_parts.append(
-                    f"**Geographic Focus:** {', '.join(icp.geographic_focus)}"
-                )
-
-            if icp.disqualifying_signals:
-                icp_parts.append(
-                    f"**Disqualifying Signals:** {', '.join(icp.disqualifying_signals)}"
-                )
-
-            if icp_parts:
-                parts.append("\n--- Ideal Client Profile ---\n" + "\n".join(icp_parts))
-
-        # Add qualifying questions
-        if cfg.qualifying_questions:
-            questions = "\n".join(f"- {q}" for q in cfg.qualifying_questions)
-            parts.append(
-                f"\n--- Qualifying Questions ---\nConsider these when classifying:\n{questions}"
-            )
-
-        # Add custom instructions
-        if cfg.custom_instructions:
-            parts.append(
-                f"\n--- Additional Instructions ---\n{cfg.custom_instructions}"
-            )
-
-        return "\n".join(parts)
+        return self._build_lead_prompt(
+            BASE_SYSTEM_PROMPT, "Consider these when classifying:"
+        )
 
+    @_cached_prompt
     def build_triage_prompt(self) -> str:
         """
         Build triage system prompt.
 
         Uses the same deployment-specific config as classification, but tuned for speed.
         """
-        # Reuse the classification prompt sections (company context, ICP, questions, etc.),
-        # but with a triage-focused base prompt.
-        parts = [BASE_TRIAGE_PROMPT]
+        return self._build_lead_prompt(
+            BASE_TRIAGE_PROMPT, "Consider these during triage:"
+        )
+
+    def _build_lead_prompt(self, base_prompt: str, questions_intro: str) -> str:
+        """
+        Shared body of the classification and triage prompts: the base prompt
+        followed by company context, ICP, qualifying questions and custom
+        instructions, each rendered as one section string.
+        """
         cfg = self.config
+        sections = [base_prompt]
 
         # Add company context
         if cfg.company_name or cfg.services_description:
-            context_parts = []
-            if cfg.company_name:
-                context_parts.append(f"Company: {cfg.company_name}")
-            if cfg.services_description:
-                context_parts.append(f"Services: {cfg.services_description}")
-            parts.append(
-                "\n--- Internal Company Context ---\n" + "\n".join(context_parts)
+            company = f"\nCompany: {cfg.company_name}" if cfg.company_name else ""
+            services = (
+                f"\nServices: {cfg.services_description}"
+                if cfg.services_description
+                else ""
             )
+            sections.append(f"\n--- Internal Company Context ---{company}{services}")
 
         # Add ICP criteria
-        if cfg.icp and not cfg.icp.model_dump(exclude_none=True) == {}:
-            icp = cfg.icp
-            icp_parts = []
-
-            if icp.description:
-                icp_parts.append(f"**Target Profile:** {icp.description}")
-            if icp.target_industries:
-                icp_parts.append(
-                    f"**Target Industries:** {', '.join(icp.target_industries)}"
-                )
-            if icp.target_company_sizes:
-                icp_parts.append(
-                    f"**Target Company Sizes:** {', '.join(icp.target_company_sizes)}"
-                )
-            if icp.target_roles:
-                icp_parts.append(
-                    f"**Decision Maker Roles:** {', '.join(icp.target_roles)}"
-                )
-            if icp.geographic_focus:
-                icp_parts.append(
-                    f"**Geographic Focus:** {', '.join(icp.geographic_focus)}"
-                )
-            if icp.disqualifying_signals:
-                icp_parts.append(
-                    f"**Disqualifying Signals:** {', '.join(icp.disqualifying_signals)}"
-                )
-
-            if icp_parts:
-                parts.append("\n--- Ideal Client Profile ---\n" + "\n".join(icp_parts))
+        icp_lines = self._icp_lines(_LEAD_ICP_LABELS)
+        if icp_lines:
+            sections.append("\n--- Ideal Client Profile ---\n" + "\n".join(icp_lines))
 
         # Add qualifying questions
         if cfg.qualifying_questions:
             questions = "\n".join(f"- {q}" for q in cfg.qualifying_questions)
-            parts.append(
-                f"\n--- Qualifying Questions ---\nConsider these during triage:\n{questions}"
+            sections.append(
+                f"\n--- Qualifying Questions ---\n{questions_intro}\n{questions}"
             )
 
         # Add custom instructions
         if cfg.custom_instructions:
-            parts.append(
+            sections.append(
                 f"\n--- Additional Instructions ---\n{cfg.custom_instructions}"
             )
 
-        return "\n".join(parts)
-
+        return "\n".join(sections)
+
+    def _icp_lines(self, labels: tuple[tuple[str, str], ...]) -> list[str]:
+        """Render one labelled line per set ICP field, in `labels` order."""
+        icp = self.config.icp
+        if icp is None or icp.is_empty():
+            return []
+        joined = self._icp_joined
+        return [
+            template.format(value if isinstance(value, str) else getattr(joined, name))
+            for name, template in labels
+            if (value := getattr(icp, name))
+        ]
+
+    @_cached_prompt
     def build_scoring_prompt(self) -> str:
         """Build scoring system prompt."""
         parts = [BASE_SCORING_PROMPT]
         cfg = self.config
 
         # Add ICP context so scoring can incorporate fit.
-        if cfg.icp:
-            icp = cfg.icp
-            icp_parts = []
-
-            if icp.description:
-                icp_parts.append(f"**Ideal Profile:** {icp.description}")
-            if icp.target_industries:
-                icp_parts.append(
-                    f"**Priority Industries:** {', '.join(icp.target_industries)}"
-                )
-            if icp.target_company_sizes:
-                icp_parts.append(
-                    f"**Target Company Sizes:** {', '.join(icp.target_company_sizes)}"
-                )
-            if icp.target_roles:
-                icp_parts.append(
-                    f"**Decision Maker Roles:** {', '.join(icp.target_roles)}"
-                )
-            if icp.disqualifying_signals:
-                icp_parts.append(
-                    f"**Red Flags:** {', '.join(icp.disqualifying_signals)}"
-                )
-
-            if icp_parts:
-                parts.append("\n--- Ideal Client Profile ---\n" + "\n".join(icp_parts))
+        icp_lines = self._icp_lines(_FIT_ICP_LABELS)
+        if icp_lines:
+            parts.append("\n--- Ideal Client Profile ---\n" + "\n".join(icp_lines))
 
         # Add qualifying questions (what matters for prioritization)
         if cfg.qualifying_questions:
@@ -325,6 +335,7 @@ class PromptManager:
 
         return "\n".join(parts)
 
+    @_cached_prompt
     def build_research_prompt(self) -> str:
         """
         Build the complete research system prompt.
@@ -347,38 +358,12 @@ class PromptManager:
             )
 
         # Add ICP context - what makes a lead valuable to us
-        if cfg.icp:
-            icp = cfg.icp
-            icp_parts = []
-
-            if icp.description:
-                icp_parts.append(f"**Ideal Profile:** {icp.description}")
-
-            if icp.target_industries:
-                icp_parts.append(
-                    f"**Priority Industries:** {', '.join(icp.target_industries)}"
-                )
-
-            if icp.target_company_sizes:
-                icp_parts.append(
-                    f"**Target Company Sizes:** {', '.join(icp.target_company_sizes)}"
-                )
-
-            if icp.target_roles:
-                icp_parts.append(
-                    f"**Decision Maker Roles:** {', '.join(icp.target_roles)}"
-                )
-
-            if icp.disqualifying_signals:
-                icp_parts.append(
-                    f"**Red Flags:** {', '.join(icp.disqualifying_signals)}"
-                )
-
-            if icp_parts:
-                parts.append(
-                    "\n--- Ideal Client Profile ---\nUse this context to assess fit:\n"
-                    + "\n".join(icp_parts)
-                )
+        icp_lines = self._icp_lines(_FIT_ICP_LABELS)
+        if icp_lines:
+            parts.append(
+                "\n--- Ideal Client Profile ---\nUse this context to assess fit:\n"
+                + "\n".join(icp_lines)
+            )
 
         # Add a concrete operator clause pack derived from prompt_config to improve query quality
         clause_pack_lines: list[str] = []
@@ -427,10 +412,25 @@ class PromptManager:
         return "\n".join(parts)
 
 
+# Searched in order when no path is given and PROMPT_CONFIG_PATH is unset
+_DEFAULT_CONFIG_PATHS = (
+    Path("prompt_config.json"),
+    Path("config/prompt_config.json"),
+)
+
+
+# Parsed configs keyed by absolute path, reused while (mtime, size) is unchanged
+_config_cache: dict[str, tuple[tuple[int, int], PromptConfig]] = {}
+
+
 def load_prompt_config_from_file(path: Path | str | None = None) -> PromptConfig:
     """
     Load prompt configuration from JSON file.
 
+    Parsed configs are cached per file until its mtime or size changes, so
+    resetting the prompt manager doesn't re-parse an unchanged file. Treat the
+    returned config as read-only.
+
     Args:
         path: Explicit path to config file. If None, searches in order:
               1. PROMPT_CONFIG_PATH environment variable
@@ -439,39 +439,41 @@ def load_prompt_config_from_file(path: Path | str | None = None) -> PromptConfig
     """
     import os
 
-    if path is None:
-        # Check environment variable first
+    env_path = None
+    if path is not None:
+        candidates: tuple[Path, ...] = (Path(path),)
+    else:
+        # Check environment variable first, then the default locations
         env_path = os.environ.get("PROMPT_CONFIG_PATH")
+        candidates = (Path(env_path),) if env_path else _DEFAULT_CONFIG_PATHS
+
+    # One stat per candidate doubles as the existence check and the cache key
+    for path in candidates:
+        try:
+            st = path.stat()
+        except OSError:
+            # Missing, under a non-directory, unreadable, ...: like is_file()
+            continue
+        if S_ISREG(st.st_mode):
+            break
+    else:
         if env_path:
-            path = Path(env_path)
-            if not path.is_file():
-                print(f"[WARN] PROMPT_CONFIG_PATH set but file not found: {env_path}")
-                return PromptConfig()
-        else:
-            # Search for config file in default locations
-            candidates = [
-                Path("prompt_config.json"),
-                Path("config/prompt_config.json"),
-                Path.cwd() / "prompt_config.json",
-            ]
-            for candidate in candidates:
-                if candidate.is_file():
-                    path = candidate
-                    break
-
-    if path is None:
-        return PromptConfig()
+            print(f"[WARN] PROMPT_CONFIG_PATH set but file not found: {env_path}")
+        return _EMPTY_CONFIG
 
-    path = Path(path)
-    if not path.is_file():
-        return PromptConfig()
+    key = os.path.abspath(path)
+    version = (st.st_mtime_ns, st.st_size)
+    cached = _config_cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
 
     try:
-        data = json.loads(path.read_text())
-        return PromptConfig.model_validate(data)
-    except (json.JSONDecodeError, ValueError) as e:
+        config = PromptConfig.model_validate(json_loads(path.read_bytes()))
+    except (OSError, json.JSONDecodeError, ValueError) as e:
         print(f"[WARN] Failed to load prompt config from {path}: {e}")
-        return PromptConfig()
+        return _EMPTY_CONFIG
+    _config_cache[key] = (version, config)
+    return config
 
 
 def load_prompt_config() -> PromptConfig:
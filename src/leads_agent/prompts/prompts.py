@@ -10,32 +10,26 @@ Classification decision:
 - promising: potentially real business intent worth investigating
 
 Rules:
-- Be conservative — if unclear, choose ignore
+- Be conservative - if unclear, choose ignore
 - Extract the company name from the message or email domain if not provided
 - Provide a brief reason for your classification
 - Also provide a 1-2 sentence lead summary and a few key signals/tags
 """
 
 # Fast triage prompt — explicitly aimed at ruling out obvious low-quality leads.
+# Sent as the prefix of every triage request, so keep it short and byte-stable
+# (ASCII, fixed label order) for server-side prefix caching.
 BASE_TRIAGE_PROMPT = """\
-You are doing FAST triage on inbound leads.
+You are doing FAST triage on inbound leads from a company contact form.
 
-Goal:
-- Quickly rule out leads that are clearly not worth pursuing (spam, scams, students, resumes, solicitations).
-- If the lead is potentially real business, mark it as promising even if details are incomplete.
+Labels:
+- ignore: clearly not worth pursuing (spam, scams, students, resumes, solicitations)
+- promising: potentially real business intent, even if details are incomplete
 
-Output requirements:
-- Always extract/confirm contact details if present.
-- Always infer company from email domain when helpful.
-- Always produce:
-  - label (ignore/promising)
-  - confidence (0-1)
-  - reason (brief)
-  - lead_summary (1-2 sentences)
-  - key_signals (3-8 short strings)
-
-Conservatism:
+Rules:
 - If unclear and no real business intent is evident, choose ignore.
+- Extract contact details if present; infer company from the email domain when helpful.
+- Always give confidence (0-1), a brief reason, a 1-2 sentence lead_summary and 3-8 short key_signals.
 """
 
 # Base research prompt - defines HOW to research (mechanics) + how to write good DuckDuckGo queries
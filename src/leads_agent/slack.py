@@ -1,13 +1,136 @@
-from slack_sdk import WebClient
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, TypeVar
 
 from leads_agent.config import Settings
+from leads_agent.models import HubSpotLead
+
+if TYPE_CHECKING:
+    from slack_sdk import WebClient
+
+T = TypeVar("T")
 
 
 def slack_client(settings: Settings) -> WebClient:
-    """Create a Slack WebClient instance."""
+    """Get the shared Slack WebClient for the configured bot token."""
     token = (
         settings.slack_bot_token.get_secret_value()
         if settings.slack_bot_token
         else None
     )
+    return _web_client(token)
+
+
+@lru_cache(maxsize=4)
+def _web_client(token: str | None) -> WebClient:
+    # Imported on first use so backtests and the prompt tools don't load slack_sdk
+    from slack_sdk import WebClient
+
+    # WebClient is thread-safe; one instance per token is shared by all callers
     return WebClient(token=token)
+
+
+_HUBSPOT_USERNAMES = frozenset({"hubspot"})
+
+
+def is_hubspot_lead_event(event: dict, channel_id: str | None = None) -> bool:
+    """
+    Check if a message event is a top-level HubSpot lead post.
+
+    Shared by the Socket Mode handlers, backtest, and replay. Checks are ordered
+    so the most selective (and cheapest) reject first.
+    """
+    get = event.get
+    # Must be a bot_message from HubSpot
+    if get("subtype") != "bot_message":
+        return False
+    if (get("username") or "").lower() not in _HUBSPOT_USERNAMES:
+        return False
+    # Must have attachments (where HubSpot puts lead data)
+    if not get("attachments"):
+        return False
+    # Skip thread replies (only process top-level messages)
+    thread_ts = get("thread_ts")
+    if thread_ts and thread_ts != get("ts"):
+        return False
+    # Filter by channel if requested
+    if channel_id and get("channel") != channel_id:
+        return False
+    return True
+
+
+def _iter_history_pages(
+    client: WebClient,
+    channel: str,
+    *,
+    page_size: int,
+    process_page: Callable[[list[dict]], T],
+) -> Iterator[T]:
+    """
+    Fetch a channel's history page by page (newest first), following cursors.
+
+    Each page is fetched and run through `process_page` on a background thread,
+    while the caller consumes the previous page.
+    """
+
+    def fetch(cursor: str | None) -> tuple[str | None, T]:
+        kwargs: dict = {"channel": channel, "limit": page_size}
+        if cursor:
+            kwargs["cursor"] = cursor
+        resp = client.conversations_history(**kwargs)
+        next_cursor = (resp.get("response_metadata") or {}).get("next_cursor")
+        return next_cursor or None, process_page(resp.get("messages", []))
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        next_page = executor.submit(fetch, None)
+        while next_page is not None:
+            cursor, page = next_page.result()
+            next_page = executor.submit(fetch, cursor) if cursor else None
+            yield page
+    finally:
+        # Don't block on a prefetched page the caller no longer needs
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_channel_history(
+    client: WebClient, channel: str, *, page_size: int = 200
+) -> Iterator[dict]:
+    """
+    Yield messages from a channel's history (newest first), following cursors.
+
+    The next page is requested in the background while the current page is
+    consumed, so page fetches overlap with the caller's processing.
+    """
+    for messages in _iter_history_pages(
+        client, channel, page_size=page_size, process_page=lambda page: page
+    ):
+        yield from messages
+
+
+def iter_hubspot_lead_pages(
+    client: WebClient, channel: str, *, page_size: int = 200
+) -> Iterator[tuple[int, list[tuple[dict, HubSpotLead]]]]:
+    """
+    Yield `(messages_scanned, leads)` for each page of a channel's history.
+
+    Filtering and parsing happen on the prefetch thread as each page arrives, so
+    the caller receives ready-to-process `(event, lead)` pairs.
+    """
+
+    def parse(messages: list[dict]) -> tuple[int, list[tuple[dict, HubSpotLead]]]:
+        leads: list[tuple[dict, HubSpotLead]] = []
+        for msg in messages:
+            # History messages don't include channel; add for parity with event payloads
+            event = {**msg, "channel": channel}
+            if not is_hubspot_lead_event(event):
+                continue
+            lead = HubSpotLead.from_slack_event(event)
+            if lead:
+                leads.append((event, lead))
+        return len(messages), leads
+
+    return _iter_history_pages(client, channel, page_size=page_size, process_page=parse)